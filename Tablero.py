@@ -1,180 +1,48 @@
-import random
+import asyncio
+import time
+
 import matplotlib.pyplot as plt
 import networkx as nx
 from matplotlib.patches import Rectangle
 from matplotlib.collections import PatchCollection
-import os
-from matplotlib.gridspec import GridSpec
-import time
 
-class ChessBoardGame:
-    def __init__(self):
-        """Inicializa el juego con el tablero y configuraciones iniciales"""
-        self.board_size = 4
-        self.positions = {
-            'P1': {'current': 1, 'start': 1, 'end': 16},
-            'P2': {'current': 4, 'start': 4, 'end': 13}
-        }
-        self.turn = None
-        self.moves_history = {'P1': [], 'P2': []}
-        self.all_possible_moves = {'P1': set(), 'P2': set()}
-        self.winning_moves = {'P1': set(), 'P2': set()}
-        self.move_symbols = ['U', 'D', 'L', 'R', 'UL', 'UR', 'DL', 'DR']
-        self.max_moves = 0
-        self.current_move_count = 0
-        self.game_over = False
-        self.winner = None
-        self.mode = None
-        self.move_sequence = {'P1': [], 'P2': []}
-        
-        # Configurar figura unificada
-        self.fig = plt.figure(figsize=(14, 7))
-        self.gs = GridSpec(1, 2, width_ratios=[1, 1.5])
-        
-        # Añadir texto para el temporizador
-        self.timer_text = None
-        
-        if not os.path.exists('output'):
-            os.makedirs('output')
+from motor import GameEngine, GameObserver
+from planificador import MoveScheduler
+from renderizador import IncrementalRenderer, player_color, special_node_colors
 
-    def initialize_game(self, mode='auto', max_moves=10, move_sequence=None):
-        """Inicializa el juego con los parámetros dados"""
-        self.mode = mode
-        self.max_moves = max(max_moves, 3)
-        self.max_moves = min(self.max_moves, 100)
-        
-        self.turn = 'P1' if random.randint(0, 1) == 0 else 'P2'
-        print(f"El jugador {self.turn} comienza primero.")
-        
-        if mode == 'manual' and move_sequence:
-            seq_len = len(move_sequence)
-            self.move_sequence['P1'] = list(move_sequence[:seq_len//2])
-            self.move_sequence['P2'] = list(move_sequence[seq_len//2:])
-        elif mode == 'manual':
-            self.move_sequence['P1'] = [random.choice(self.move_symbols) for _ in range(self.max_moves//2)]
-            self.move_sequence['P2'] = [random.choice(self.move_symbols) for _ in range(self.max_moves//2)]
+class ChessBoardGame(GameEngine, GameObserver):
+    def __init__(self, board_size=4, tick=1.0, players=None):
+        """Inicializa el juego con el tablero y la vista gráfica como observador del motor"""
+        super().__init__(board_size=board_size, verbose=True, players=players)
+        
+        # Figura unificada con artistas persistentes que se actualizan por blitting
+        self.renderer = IncrementalRenderer(self)
+        self.fig = self.renderer.fig
+        self.add_observer(self)
+        
+        # Planificador de turnos: segundos por paso de la cuenta regresiva
+        self.scheduler = MoveScheduler(self, tick=tick, on_tick=self.update_timer_display,
+                                       on_idle=self.fig.canvas.flush_events)
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key_press)
 
     def update_timer_display(self, seconds_left):
         """Actualiza el display del temporizador"""
-        if self.timer_text is not None:
-            self.timer_text.remove()
-        
-        self.timer_text = self.fig.text(
-            0.5, 0.95, 
-            f"Tiempo para próximo movimiento: {seconds_left} segundos", 
-            ha='center', va='top', fontsize=12, color='red'
-        )
-        plt.draw()
+        self.renderer.set_timer(seconds_left)
 
-    def countdown(self, duration=10):
-        """Muestra una cuenta regresiva"""
-        for i in range(duration, 0, -1):
-            self.update_timer_display(i)
-            plt.pause(1)
-        
-        self.update_timer_display(0)
-        plt.pause(0.5)
+    def on_key_press(self, event):
+        """Espacio pausa o reanuda la partida; 'f' alterna el avance rápido"""
+        if event.key == ' ':
+            self.scheduler.toggle_pause()
+        elif event.key == 'f':
+            self.scheduler.set_tick(0 if self.scheduler.tick else 1.0)
 
-    def position_to_coords(self, position):
-        """Convierte número de posición (1-16) a coordenadas del tablero (fila, columna)"""
-        row = (position - 1) // self.board_size
-        col = (position - 1) % self.board_size
-        return row, col
-    
-    def coords_to_position(self, row, col):
-        """Convierte coordenadas del tablero a número de posición"""
-        return row * self.board_size + col + 1
-    
-    def is_valid_move(self, player, move):
-        """Verifica si un movimiento es válido para la posición actual del jugador"""
-        current_pos = self.positions[player]['current']
-        row, col = self.position_to_coords(current_pos)
-        
-        if move == 'U':
-            new_row, new_col = row - 1, col
-        elif move == 'D':
-            new_row, new_col = row + 1, col
-        elif move == 'L':
-            new_row, new_col = row, col - 1
-        elif move == 'R':
-            new_row, new_col = row, col + 1
-        elif move == 'UL':
-            new_row, new_col = row - 1, col - 1
-        elif move == 'UR':
-            new_row, new_col = row - 1, col + 1
-        elif move == 'DL':
-            new_row, new_col = row + 1, col - 1
-        elif move == 'DR':
-            new_row, new_col = row + 1, col + 1
-        else:
-            return False
-        
-        if 0 <= new_row < self.board_size and 0 <= new_col < self.board_size:
-            new_pos = self.coords_to_position(new_row, new_col)
-            other_player = 'P2' if player == 'P1' else 'P1'
-            if new_pos != self.positions[other_player]['current']:
-                return True
-        return False
-    
-    def get_possible_moves(self, player):
-        """Obtiene todos los movimientos válidos para un jugador"""
-        possible_moves = []
-        for move in self.move_symbols:
-            if self.is_valid_move(player, move):
-                possible_moves.append(move)
-        return possible_moves
-    
-    def make_move(self, player, move):
-        """Ejecuta un movimiento para un jugador"""
-        if self.game_over:
-            return False
-            
-        current_pos = self.positions[player]['current']
-        row, col = self.position_to_coords(current_pos)
-        
-        if move == 'U':
-            new_row, new_col = row - 1, col
-        elif move == 'D':
-            new_row, new_col = row + 1, col
-        elif move == 'L':
-            new_row, new_col = row, col - 1
-        elif move == 'R':
-            new_row, new_col = row, col + 1
-        elif move == 'UL':
-            new_row, new_col = row - 1, col - 1
-        elif move == 'UR':
-            new_row, new_col = row - 1, col + 1
-        elif move == 'DL':
-            new_row, new_col = row + 1, col - 1
-        elif move == 'DR':
-            new_row, new_col = row + 1, col + 1
-        
-        new_pos = self.coords_to_position(new_row, new_col)
-        self.positions[player]['current'] = new_pos
-        self.moves_history[player].append((current_pos, new_pos, move))
-        
-        for possible_move in self.get_possible_moves(player):
-            self.all_possible_moves[player].add((current_pos, possible_move))
-            if new_pos == self.positions[player]['end']:
-                self.winning_moves[player].add((current_pos, possible_move))
-        
-        if new_pos == self.positions[player]['end']:
-            self.game_over = True
-            self.winner = player
-            print(f"¡El jugador {player} ha ganado!")
-            return True
-        
-        self.current_move_count += 1
-        if self.current_move_count >= self.max_moves:
-            self.game_over = True
-            print("Juego terminado sin ganador (límite de movimientos alcanzado).")
-            return False
-        
-        self.turn = 'P2' if player == 'P1' else 'P1'
-        return True
+    def run_loop(self):
+        """Juega la partida con el planificador asíncrono en lugar de esperas bloqueantes"""
+        asyncio.run(self.scheduler.run())
 
     def draw_board(self, ax):
         """Dibuja el tablero en el eje proporcionado"""
+        start = time.perf_counter()
         ax.clear()
         ax.set_xlim(0, self.board_size)
         ax.set_ylim(0, self.board_size)
@@ -193,7 +61,7 @@ class ChessBoardGame:
         pc = PatchCollection(rectangles, match_original=True)
         ax.add_collection(pc)
         
-        for player in ['P1', 'P2']:
+        for player in self.players:
             start_pos = self.positions[player]['start']
             end_pos = self.positions[player]['end']
             
@@ -208,12 +76,12 @@ class ChessBoardGame:
             ax.text(end_col + 0.5, end_row_plt + 0.7, f"Fin {player}", 
                    ha='center', va='center', fontsize=8)
         
-        for player in ['P1', 'P2']:
+        for player in self.players:
             pos = self.positions[player]['current']
             row, col = self.position_to_coords(pos)
             row_plt = self.board_size - 1 - row
             
-            color = 'red' if player == 'P1' else 'blue'
+            color = player_color(self, player)
             ax.plot(col + 0.5, row_plt + 0.5, 'o', markersize=20, 
                    color=color, alpha=0.5, label=f'Jugador {player}')
             
@@ -221,7 +89,7 @@ class ChessBoardGame:
                    ha='center', va='center', color='white', fontweight='bold')
         
         for player, history in self.moves_history.items():
-            color = 'red' if player == 'P1' else 'blue'
+            color = player_color(self, player)
             for move in history:
                 from_pos, to_pos, _ = move
                 from_row, from_col = self.position_to_coords(from_pos)
@@ -235,18 +103,20 @@ class ChessBoardGame:
                          head_width=0.1, head_length=0.1, fc=color, ec=color, alpha=0.3)
         
         ax.legend(loc='upper right')
+        self.profiler.add_time('draw_board', time.perf_counter() - start, start)
 
     def draw_full_nfa(self, ax):
         """Dibuja el NFA en el eje proporcionado"""
+        start = time.perf_counter()
         ax.clear()
         G = nx.DiGraph()
         
-        for pos in range(1, 17):
+        for pos in range(1, self.board.num_positions + 1):
             G.add_node(pos)
         
         edge_labels = {}
-        for player in ['P1', 'P2']:
-            color = 'red' if player == 'P1' else 'blue'
+        for player in self.players:
+            color = player_color(self, player)
             for (from_pos, move) in self.all_possible_moves[player]:
                 if self.is_valid_move_from_position(player, from_pos, move):
                     to_pos = self.calculate_new_position(from_pos, move)
@@ -254,23 +124,20 @@ class ChessBoardGame:
                         G.add_edge(from_pos, to_pos, color=color, move=move)
                         edge_labels[(from_pos, to_pos)] = move
         
+        built = time.perf_counter()
+        self.profiler.add_time('nfa_graph', built - start, start)
+        
         pos_layout = {}
         for node in G.nodes():
             row, col = self.position_to_coords(node)
             pos_layout[node] = (col, self.board_size - 1 - row)
         
         edge_colors = [G[u][v]['color'] for u, v in G.edges()]
-        node_colors = ['lightgray' for _ in G.nodes()]
+        special = special_node_colors(self)
+        node_colors = [special.get(node, 'lightgray') for node in G.nodes()]
         
-        for i, node in enumerate(G.nodes()):
-            if node == self.positions['P1']['start']:
-                node_colors[i] = 'pink'
-            elif node == self.positions['P1']['end']:
-                node_colors[i] = 'lightcoral'
-            elif node == self.positions['P2']['start']:
-                node_colors[i] = 'lightblue'
-            elif node == self.positions['P2']['end']:
-                node_colors[i] = 'deepskyblue'
+        laid_out = time.perf_counter()
+        self.profiler.add_time('layout', laid_out - built, built)
         
         nx.draw(G, pos_layout, ax=ax, with_labels=True, node_color=node_colors, 
                edge_color=edge_colors, node_size=800, font_weight='bold')
@@ -279,209 +146,40 @@ class ChessBoardGame:
                                     font_color='green', ax=ax)
         
         ax.set_title("Red NFA de Movimientos")
+        self.profiler.add_time('nfa_draw', time.perf_counter() - laid_out, laid_out)
 
     def update_display(self):
-        """Actualiza toda la visualización en una sola ventana"""
-        if not hasattr(self, 'ax_board'):
-            self.ax_board = self.fig.add_subplot(self.gs[0])
-        if not hasattr(self, 'ax_nfa'):
-            self.ax_nfa = self.fig.add_subplot(self.gs[1])
-        
-        self.draw_board(self.ax_board)
-        self.draw_full_nfa(self.ax_nfa)
-        
-        if not self.game_over:
-            turn_text = f"Turno actual: Jugador {self.turn}"
-            self.fig.text(0.5, 0.02, turn_text, ha='center', va='bottom', fontsize=12)
-        
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.draw()
-        
-        if not self.game_over:
-            self.countdown()
+        """Actualiza la visualización redibujando solo lo que cambió desde el último cuadro"""
+        self.renderer.render()
 
-    def is_valid_move_from_position(self, player, from_pos, move):
-        """Verifica si un movimiento es válido desde una posición dada"""
-        row, col = self.position_to_coords(from_pos)
-        
-        if move == 'U':
-            new_row, new_col = row - 1, col
-        elif move == 'D':
-            new_row, new_col = row + 1, col
-        elif move == 'L':
-            new_row, new_col = row, col - 1
-        elif move == 'R':
-            new_row, new_col = row, col + 1
-        elif move == 'UL':
-            new_row, new_col = row - 1, col - 1
-        elif move == 'UR':
-            new_row, new_col = row - 1, col + 1
-        elif move == 'DL':
-            new_row, new_col = row + 1, col - 1
-        elif move == 'DR':
-            new_row, new_col = row + 1, col + 1
-        
-        if 0 <= new_row < self.board_size and 0 <= new_col < self.board_size:
-            return True
-        return False
-    
-    def calculate_new_position(self, from_pos, move):
-        """Calcula la nueva posición desde una posición y movimiento dados"""
-        row, col = self.position_to_coords(from_pos)
-        
-        if move == 'U':
-            new_row, new_col = row - 1, col
-        elif move == 'D':
-            new_row, new_col = row + 1, col
-        elif move == 'L':
-            new_row, new_col = row, col - 1
-        elif move == 'R':
-            new_row, new_col = row, col + 1
-        elif move == 'UL':
-            new_row, new_col = row - 1, col - 1
-        elif move == 'UR':
-            new_row, new_col = row - 1, col + 1
-        elif move == 'DL':
-            new_row, new_col = row + 1, col - 1
-        elif move == 'DR':
-            new_row, new_col = row + 1, col + 1
-        
-        if 0 <= new_row < self.board_size and 0 <= new_col < self.board_size:
-            return self.coords_to_position(new_row, new_col)
-        return None
-
-    def auto_play(self):
-        """Juega automáticamente el juego con temporizador"""
-        if self.mode != 'auto':
-            print("El modo no es automático.")
-            return
-        
-        print("Iniciando juego en modo automático...")
+    def on_game_start(self, game):
+        """Dibuja el estado inicial de la partida"""
+        self.renderer.reset()
         self.update_display()
-        
-        while not self.game_over and self.current_move_count < self.max_moves:
-            player = self.turn
-            possible_moves = self.get_possible_moves(player)
-            
-            if not possible_moves:
-                print(f"El jugador {player} no tiene movimientos válidos. Pasando turno.")
-                self.turn = 'P2' if player == 'P1' else 'P1'
-                self.current_move_count += 1
-                self.update_display()
-                continue
-                
-            move = random.choice(possible_moves)
-            print(f"Jugador {player} mueve desde {self.positions[player]['current']} con {move}")
-            self.make_move(player, move)
-            self.update_display()
-        
-        if self.winner:
-            result_text = f"¡Jugador {self.winner} ha ganado!"
-        else:
-            result_text = "Juego terminado sin ganador (límite de movimientos alcanzado)."
-        
-        self.fig.text(0.5, 0.02, result_text, ha='center', va='bottom', fontsize=12, color='green')
-        plt.draw()
-        
-        self.generate_output_files()
-        plt.pause(5)
 
-    def manual_play(self):
-        """Juega manualmente con secuencias predefinidas y temporizador"""
-        if self.mode != 'manual':
-            print("El modo no es manual.")
-            return
-        
-        print("Iniciando juego en modo manual...")
-        print(f"Secuencia P1: {self.move_sequence['P1']}")
-        print(f"Secuencia P2: {self.move_sequence['P2']}")
+    def on_turn_end(self, game):
+        """Redibuja el tablero tras cada movimiento o turno pasado"""
         self.update_display()
-        
-        p1_idx = p2_idx = 0
-        
-        while not self.game_over and self.current_move_count < self.max_moves:
-            player = self.turn
-            move_sequence = self.move_sequence[player]
-            current_idx = p1_idx if player == 'P1' else p2_idx
-            
-            if current_idx >= len(move_sequence):
-                print(f"Secuencia de movimientos agotada para {player}. Pasando turno.")
-                self.turn = 'P2' if player == 'P1' else 'P1'
-                self.current_move_count += 1
-                self.update_display()
-                continue
-                
-            move = move_sequence[current_idx]
-            
-            if player == 'P1':
-                p1_idx += 1
-            else:
-                p2_idx += 1
-                
-            if self.is_valid_move(player, move):
-                print(f"Jugador {player} mueve desde {self.positions[player]['current']} con {move}")
-                self.make_move(player, move)
-                self.update_display()
-            else:
-                print(f"Movimiento {move} no válido para {player} en posición {self.positions[player]['current']}. Intentando reconfigurar...")
-                possible_moves = self.get_possible_moves(player)
-                if possible_moves:
-                    move = random.choice(possible_moves)
-                    print(f"Reconfigurado: {player} mueve con {move} en lugar")
-                    self.make_move(player, move)
-                    self.update_display()
-                else:
-                    print(f"No hay movimientos válidos para {player}. Pasando turno.")
-                    self.turn = 'P2' if player == 'P1' else 'P1'
-                    self.current_move_count += 1
-                    self.update_display()
-        
+
+    def on_game_over(self, game):
+        """Muestra el resultado final y genera los archivos de salida"""
         if self.winner:
             result_text = f"¡Jugador {self.winner} ha ganado!"
         else:
             result_text = "Juego terminado sin ganador (límite de movimientos alcanzado)."
         
-        self.fig.text(0.5, 0.02, result_text, ha='center', va='bottom', fontsize=12, color='green')
-        plt.draw()
+        self.renderer.show_result(result_text)
         
         self.generate_output_files()
-        plt.pause(5)
-
-    def generate_output_files(self):
-        """Genera archivos de salida con todos los movimientos y movimientos ganadores"""
-        with open('output/all_possible_moves.txt', 'w') as f:
-            f.write("Todos los movimientos posibles:\n")
-            for player in ['P1', 'P2']:
-                f.write(f"\nJugador {player}:\n")
-                for from_pos, move in sorted(self.all_possible_moves[player]):
-                    to_pos = self.calculate_new_position(from_pos, move)
-                    f.write(f"Desde {from_pos} con {move} -> {to_pos}\n")
-        
-        with open('output/winning_moves.txt', 'w') as f:
-            f.write("Movimientos ganadores:\n")
-            for player in ['P1', 'P2']:
-                f.write(f"\nJugador {player}:\n")
-                if self.winning_moves[player]:
-                    for from_pos, move in sorted(self.winning_moves[player]):
-                        to_pos = self.calculate_new_position(from_pos, move)
-                        f.write(f"Desde {from_pos} con {move} -> {to_pos} (GANA)\n")
-                else:
-                    f.write("No se encontraron movimientos ganadores.\n")
-        
-        with open('output/move_history.txt', 'w') as f:
-            f.write("Historial de movimientos:\n")
-            for player in ['P1', 'P2']:
-                f.write(f"\nJugador {player}:\n")
-                for i, (from_pos, to_pos, move) in enumerate(self.moves_history[player], 1):
-                    f.write(f"Movimiento {i}: Desde {from_pos} con {move} -> {to_pos}\n")
-        
-        print("Archivos de salida generados en la carpeta 'output'.")
+        with self.profiler.phase('wait'):
+            self.fig.canvas.start_event_loop(5)
 
 def main():
     """Función principal con menú de opciones"""
     print("Juego de Movimientos en Tablero de Ajedrez 4x4")
     print("---------------------------------------------")
     print("NOTA: Cada movimiento tendrá un tiempo de 10 segundos de visualización")
+    print("Pulse espacio en la ventana para pausar o reanudar, 'f' para avance rápido")
     
     game = ChessBoardGame()
     
@@ -0,0 +1,193 @@
+import numpy as np
+
+from modelo import MOVE_SYMBOLS
+
+ACCEPTED = 0
+REJECTED = 1
+INVALID = 2
+RESULT_NAMES = ('aceptada', 'rechazada', 'inválida')
+
+# Identificadores especiales usados al tokenizar cadenas
+_BAD_SYMBOL = -1
+_SEPARATOR = -2
+_EMPTY = -3
+
+
+class NFA:
+    def __init__(self, states, alphabet, transitions, start, accepting):
+        """Autómata finito no determinista: transitions[(estado, símbolo)] -> conjunto de estados"""
+        self.states = set(states)
+        self.alphabet = list(alphabet)
+        self.transitions = transitions
+        self.start = start
+        self.accepting = set(accepting)
+
+    def to_dfa(self):
+        """Convierte el NFA en un DFA completo mediante construcción de subconjuntos"""
+        start = frozenset([self.start])
+        index = {start: 0}
+        subsets = [start]
+        rows = []
+
+        i = 0
+        while i < len(subsets):
+            subset = subsets[i]
+            row = []
+            for symbol in self.alphabet:
+                target = frozenset(dest for state in subset
+                                   for dest in self.transitions.get((state, symbol), ()))
+                if target not in index:
+                    index[target] = len(subsets)
+                    subsets.append(target)
+                row.append(index[target])
+            rows.append(row)
+            i += 1
+
+        table = np.array(rows, dtype=np.int32)
+        accepting = np.array([bool(subset & self.accepting) for subset in subsets])
+        return DFA(table, 0, accepting, self.alphabet)
+
+
+class DFA:
+    def __init__(self, table, start, accepting, alphabet):
+        """Autómata determinista con tabla de transiciones entera table[estado, símbolo]"""
+        self.table = table
+        self.start = start
+        self.accepting = accepting
+        self.alphabet = list(alphabet)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.alphabet)}
+
+    @property
+    def num_states(self):
+        """Número de estados del autómata, incluido el estado muerto"""
+        return self.table.shape[0]
+
+    def minimize(self):
+        """Devuelve el DFA mínimo equivalente por refinamiento de particiones"""
+        classes = self.accepting.astype(np.int64)
+        num_classes = len(np.unique(classes))
+        while True:
+            signature = np.column_stack([classes, classes[self.table]])
+            _, refined = np.unique(signature, axis=0, return_inverse=True)
+            refined = refined.reshape(-1)
+            new_count = refined.max() + 1
+            classes = refined
+            if new_count == num_classes:
+                break
+            num_classes = new_count
+
+        table = np.zeros((num_classes, len(self.alphabet)), dtype=np.int32)
+        table[classes] = classes[self.table]
+        accepting = np.zeros(num_classes, dtype=bool)
+        accepting[classes] = self.accepting
+        return DFA(table, int(classes[self.start]), accepting, self.alphabet)
+
+    def accepts(self, moves):
+        """Indica si la secuencia de símbolos es aceptada"""
+        state = self.start
+        for move in moves:
+            symbol = self.symbol_ids.get(move)
+            if symbol is None:
+                return False
+            state = self.table[state, symbol]
+        return bool(self.accepting[state])
+
+    def classify_lines(self, lines):
+        """Clasifica cadenas 'U,D,L' en aceptadas, rechazadas o inválidas; omite las vacías, como classify_file"""
+        data = b'\n'.join(line.encode() if isinstance(line, str) else line for line in lines)
+        return self._classify_block(data)
+
+    def classify_file(self, path, block_size=1 << 20):
+        """Clasifica cada línea no vacía de un archivo de cadenas de movimientos
+
+        El archivo se lee por bloques cortados en el último salto de línea,
+        así que la memoria depende de block_size y no del tamaño del archivo.
+        """
+        results = []
+        pending = b''
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(block_size)
+                if not chunk:
+                    break
+                pending += chunk
+                cut = pending.rfind(b'\n')
+                if cut < 0:
+                    continue
+                results.append(self._classify_block(pending[:cut]))
+                pending = pending[cut + 1:]
+        if pending:
+            results.append(self._classify_block(pending))
+        if not results:
+            return np.zeros(0, dtype=np.int8)
+        return np.concatenate(results)
+
+    def _classify_block(self, data):
+        """Clasifica las líneas completas de un bloque, omitiendo las vacías"""
+        ids, starts, lengths, bad, blank = self._tokenize(data)
+        keep = ~blank
+        return self._run(ids, starts[keep], lengths[keep], bad[keep])
+
+    def _tokenize(self, data):
+        """Convierte todo el texto en un solo arreglo de símbolos con sus límites por línea"""
+        lookup = {symbol.encode(): i for i, symbol in enumerate(self.alphabet)}
+        lookup[b'\n'] = _SEPARATOR
+        lookup[b''] = _EMPTY
+        data = data.upper().replace(b'\r', b'').replace(b' ', b'').replace(b'\t', b'')
+        tokens = data.replace(b'\n', b',\n,').split(b',')
+        ids = np.array([lookup.get(token, _BAD_SYMBOL) for token in tokens], dtype=np.int32)
+
+        separators = np.flatnonzero(ids == _SEPARATOR)
+        starts = np.concatenate(([0], separators + 1))
+        lengths = np.concatenate((separators, [ids.size])) - starts
+        blank = (lengths == 1) & (ids[starts] == _EMPTY)
+        bad = np.add.reduceat((ids == _BAD_SYMBOL) | (ids == _EMPTY), starts) > 0
+        return ids, starts, lengths, bad, blank
+
+    def _run(self, ids, starts, lengths, bad):
+        """Avanza todas las cadenas a la vez, un símbolo por iteración"""
+        state = np.full(len(starts), self.start, dtype=np.int32)
+        ids = np.where(ids < 0, 0, ids)
+        active = np.flatnonzero(~bad)
+        step = 0
+        while active.size:
+            active = active[lengths[active] > step]
+            state[active] = self.table[state[active], ids[starts[active] + step]]
+            step += 1
+
+        result = np.where(self.accepting[state], ACCEPTED, REJECTED).astype(np.int8)
+        result[bad] = INVALID
+        return result
+
+
+def build_player_nfa(game, player, observed_only=False):
+    """Construye el NFA de movimientos de un jugador a partir del tablero del motor
+
+    Los estados son las posiciones del tablero; el inicial y el de aceptación
+    son el inicio y el fin del jugador. Con observed_only solo se usan las
+    aristas registradas en all_possible_moves, como en draw_full_nfa.
+    """
+    transitions = {}
+    if observed_only:
+        edges = game.all_possible_moves[player]
+    else:
+        edges = ((pos, move) for pos in range(1, game.board.num_positions + 1)
+                 for move, _ in game.board.neighbors[pos])
+    for from_pos, move in edges:
+        to_pos = game.calculate_new_position(from_pos, move)
+        if to_pos:
+            transitions.setdefault((from_pos, move), set()).add(to_pos)
+
+    return NFA(range(1, game.board.num_positions + 1), MOVE_SYMBOLS, transitions,
+               game.positions[player]['start'], [game.positions[player]['end']])
+
+
+def build_player_dfa(game, player, observed_only=False):
+    """Construye el DFA mínimo que reconoce las cadenas ganadoras de un jugador"""
+    return build_player_nfa(game, player, observed_only).to_dfa().minimize()
+
+
+def summarize(results):
+    """Cuenta los resultados de una clasificación por categoría"""
+    counts = np.bincount(results, minlength=len(RESULT_NAMES))
+    return dict(zip(RESULT_NAMES, counts.tolist()))
@@ -0,0 +1,253 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from estado import GameState
+from motor import GameEngine
+
+
+def best_time(fn, repeat=5):
+    """Mejor tiempo en segundos de varias ejecuciones de fn"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_state(game, rng):
+    """Coloca las dos piezas en casillas aleatorias distintas"""
+    p1, p2 = rng.sample(range(1, game.board.num_positions + 1), 2)
+    game.set_position('P1', p1)
+    game.set_position('P2', p2)
+
+
+def bench_move_generation(board_size, calls=20000, repeat=5):
+    """Movimientos por segundo de get_possible_moves y make_move"""
+    rng = random.Random(0)
+    game = GameEngine(board_size=board_size)
+    game.initialize_game(mode='auto', max_moves=100)
+
+    states = []
+    for _ in range(256):
+        random_state(game, rng)
+        states.append((game.positions['P1']['current'], game.positions['P2']['current']))
+
+    def generate():
+        positions = game.positions
+        for i in range(calls):
+            p1, p2 = states[i & 255]
+            positions['P1']['current'] = p1
+            positions['P2']['current'] = p2
+            game.occupancy = (1 << p1) | (1 << p2)
+            game.get_possible_moves('P1')
+
+    def apply():
+        game.reset()
+        game.max_moves = 100
+        for _ in range(calls):
+            if game.game_over or game.current_move_count >= game.max_moves:
+                game.reset()
+                game.max_moves = 100
+            player = 'P1' if game.current_move_count % 2 == 0 else 'P2'
+            moves = game.get_possible_moves(player)
+            if moves:
+                game.make_move(player, moves[0])
+            else:
+                game.pass_turn(player)
+
+    state = GameState.initial(board_size)
+
+    def apply_undo():
+        for i in range(calls):
+            state.p1, state.p2 = states[i & 255]
+            moves = state.legal_moves()
+            if moves:
+                state.undo(state.apply(moves[0]))
+
+    return {
+        'get_possible_moves': calls / best_time(generate, repeat),
+        'make_move': calls / best_time(apply, repeat),
+        'state_apply_undo': calls / best_time(apply_undo, repeat),
+    }
+
+
+def bench_games(board_size, max_moves, mode, games=500, repeat=3):
+    """Partidas por segundo sin ventana, equivalentes a auto_play o manual_play"""
+    random.seed(0)
+    game = GameEngine(board_size=board_size)
+
+    def run():
+        for _ in range(games):
+            game.initialize_game(mode=mode, max_moves=max_moves)
+            if mode == 'auto':
+                game.auto_play()
+            else:
+                game.manual_play()
+
+    return games / best_time(run, repeat)
+
+
+def played_game(board_size, max_moves, seed=0):
+    """Juega una partida automática reproducible para usarla en otros benchmarks"""
+    random.seed(seed)
+    game = GameEngine(board_size=board_size)
+    game.initialize_game(mode='auto', max_moves=max_moves)
+    game.auto_play()
+    return game
+
+
+def bench_output_files(board_size, max_moves, repeat=5):
+    """Escrituras por segundo de generate_output_files para una partida terminada"""
+    game = played_game(board_size, max_moves)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            return 1 / best_time(game.generate_output_files, repeat)
+        finally:
+            os.chdir(cwd)
+
+
+def bench_rendering(board_size, max_moves, repeat=3):
+    """Segundos por cuadro de draw_board, draw_full_nfa y del renderizador incremental"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from Tablero import ChessBoardGame
+    from renderizador import IncrementalRenderer
+
+    recorded = played_game(board_size, max_moves)
+    game = ChessBoardGame(board_size=board_size)
+    game.verbose = False
+    game.reset()
+    game.max_moves = recorded.max_moves
+    game.turn = recorded.first_turn
+    for player, move in recorded.turn_log:
+        game.play_turn(player, move)
+
+    def full_frame(draw):
+        fig = Figure(figsize=(14, 7))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+
+        def frame():
+            draw(ax)
+            fig.canvas.draw()
+        return frame
+
+    # Cuadro incremental: se reproduce la partida y se promedian todos los cuadros
+    replay = GameEngine(board_size=board_size)
+    replay.reset()
+    replay.max_moves = recorded.max_moves
+    replay.turn = recorded.first_turn
+    inc_fig = Figure(figsize=(14, 7))
+    FigureCanvasAgg(inc_fig)
+    renderer = IncrementalRenderer(replay, inc_fig)
+    renderer.render()
+    frame_times = []
+    for player, move in recorded.turn_log:
+        replay.play_turn(player, move)
+        start = time.perf_counter()
+        renderer.render()
+        frame_times.append(time.perf_counter() - start)
+
+    plt.close(game.fig)
+    return {
+        'draw_board_frame': best_time(full_frame(game.draw_board), repeat),
+        'draw_full_nfa_frame': best_time(full_frame(game.draw_full_nfa), repeat),
+        'incremental_frame': sum(frame_times) / len(frame_times) if frame_times else 0.0,
+    }
+
+
+def git_commit():
+    """Commit actual del repositorio, si existe"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(board_sizes, max_moves_list, render=True):
+    """Ejecuta todos los benchmarks y devuelve resultados legibles por máquina"""
+    results = []
+
+    def add(name, value, unit, board_size, max_moves=None):
+        results.append({'name': name, 'board_size': board_size, 'max_moves': max_moves,
+                         'value': value, 'unit': unit})
+        extra = f" max_moves={max_moves}" if max_moves is not None else ""
+        print(f"{name:>22} {board_size}x{board_size}{extra}: {value:,.6g} {unit}")
+
+    for board_size in board_sizes:
+        for name, value in bench_move_generation(board_size).items():
+            add(name, value, 'moves/s', board_size)
+        for max_moves in max_moves_list:
+            add('auto_play', bench_games(board_size, max_moves, 'auto'), 'games/s', board_size, max_moves)
+            add('manual_play', bench_games(board_size, max_moves, 'manual'), 'games/s', board_size, max_moves)
+            add('generate_output_files', bench_output_files(board_size, max_moves), 'files/s',
+                board_size, max_moves)
+            if render:
+                for name, value in bench_rendering(board_size, max_moves).items():
+                    add(name, value, 's/frame', board_size, max_moves)
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(old, new):
+    """Imprime la razón nuevo/anterior de cada benchmark común; >1 es más rápido"""
+    def key(entry):
+        return entry['name'], entry['board_size'], entry['max_moves']
+
+    previous = {key(entry): entry for entry in old['results']}
+    for entry in new['results']:
+        before = previous.get(key(entry))
+        if before is None or not before['value'] or not entry['value']:
+            continue
+        ratio = entry['value'] / before['value']
+        if entry['unit'] == 's/frame':
+            ratio = 1 / ratio
+        name, board_size, max_moves = key(entry)
+        print(f"{name:>22} {board_size}x{board_size} max_moves={max_moves}: {ratio:.2f}x")
+
+
+def main(argv=None):
+    """Ejecuta el benchmark y opcionalmente lo compara con uno anterior"""
+    parser = argparse.ArgumentParser(description="Benchmarks del juego de tablero")
+    parser.add_argument('--board-sizes', type=int, nargs='+', default=[4, 8, 16])
+    parser.add_argument('--max-moves', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--no-render', action='store_true', help="omite los benchmarks de matplotlib")
+    parser.add_argument('--output', default='bench_output.json', help="archivo JSON de resultados")
+    parser.add_argument('--compare', help="JSON de una ejecución anterior para comparar")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.board_sizes, args.max_moves, render=not args.no_render)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados guardados en {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+from functools import lru_cache
+
+import numpy as np
+
+from estado import PLAYERS
+from modelo import NUM_MOVES, get_board_model
+
+
+def _goals(board):
+    """Casillas de inicio y fin de P1 y P2, como en GameEngine"""
+    last = board.num_positions
+    size = board.board_size
+    return (1, size), (last, last - size + 1)
+
+
+def edge_arrays(board_size=4):
+    """Aristas de la tabla de movimientos como arreglos (origen, destino) en formato COO"""
+    board = get_board_model(board_size)
+    table = np.frombuffer(board.table, dtype=np.intc)
+    index = np.flatnonzero(table)
+    return index // NUM_MOVES, table[index].astype(np.int64)
+
+
+def _sequence_dp(src, dst, size, start, steps, absorbing, weights=None, exact=True):
+    """Vector de conteos (o probabilidades) tras cada paso: lista de steps + 1 vectores
+
+    Se eliminan las aristas que salen de los estados de absorbing: lo que
+    llega a ellos no vuelve a salir, así que su conteo en el paso k es el
+    de primeras llegadas en exactamente k pasos.
+    """
+    keep = ~np.isin(src, sorted(absorbing)) if absorbing else np.ones(src.size, dtype=bool)
+    src, dst = src[keep], dst[keep]
+    if weights is not None:
+        weights = weights[keep]
+
+    if exact:
+        # Enteros de Python: los conteos superan int64 mucho antes de k=100
+        vector = [0] * size
+        vector[start] = 1
+        history = [vector]
+        edges = list(zip(src.tolist(), dst.tolist()))
+        for _ in range(steps):
+            nxt = [0] * size
+            for s, d in edges:
+                value = vector[s]
+                if value:
+                    nxt[d] += value
+            history.append(nxt)
+            vector = nxt
+        return history
+
+    vector = np.zeros(size)
+    vector[start] = 1.0
+    history = [vector]
+    for _ in range(steps):
+        contributions = vector[src] if weights is None else vector[src] * weights
+        nxt = np.bincount(dst, weights=contributions, minlength=size)
+        history.append(nxt)
+        vector = nxt
+    return history
+
+
+def count_paths(k, start=None, end=None, board_size=4, first_arrival=True):
+    """Número exacto de secuencias de k movimientos válidos de start a end para una pieza sola
+
+    Por defecto cuenta llegadas por primera vez en el paso k, porque la
+    partida termina al alcanzar la meta; con first_arrival=False cuenta
+    todos los caminos de longitud k.
+    """
+    return count_paths_by_length(k, start, end, board_size, first_arrival)[k]
+
+
+def count_paths_by_length(max_k, start=None, end=None, board_size=4, first_arrival=True):
+    """Lista con el número de secuencias de longitud 0..max_k de start a end"""
+    board = get_board_model(board_size)
+    starts, ends = _goals(board)
+    start = starts[0] if start is None else start
+    end = ends[0] if end is None else end
+    src, dst = edge_arrays(board_size)
+    absorbing = {end} if first_arrival else set()
+    history = _sequence_dp(src, dst, board.num_positions + 1, start, max_k, absorbing)
+    return [vector[end] for vector in history]
+
+
+def reach_probability(max_moves, start=None, end=None, board_size=4):
+    """Probabilidad de que una pieza sola, moviendo al azar entre sus movimientos válidos,
+    llegue a end en max_moves movimientos o menos"""
+    board = get_board_model(board_size)
+    starts, ends = _goals(board)
+    start = starts[0] if start is None else start
+    end = ends[0] if end is None else end
+    src, dst = edge_arrays(board_size)
+    degree = np.bincount(src, minlength=board.num_positions + 1)
+    history = _sequence_dp(src, dst, board.num_positions + 1, start, max_moves, {end},
+                           weights=1.0 / degree[src], exact=False)
+    return float(sum(vector[end] for vector in history[1:]))
+
+
+class JointChain:
+    """Espacio de estados conjunto (P1, P2, turno) con la regla de colisión
+
+    Cada transición es un turno: un movimiento válido del jugador en turno
+    o un turno pasado si no tiene ninguno. Los estados WIN_P1 y WIN_P2
+    absorben las llegadas a la meta. Las transiciones se guardan como
+    arreglos COO (origen, destino, probabilidad de la política aleatoria).
+    """
+
+    def __init__(self, board_size=4):
+        self.board_size = board_size
+        self.board = board = get_board_model(board_size)
+        self.starts, self.ends = _goals(board)
+        n = board.num_positions + 1
+        self.n = n
+        self.win_states = (2 * n * n, 2 * n * n + 1)
+        self.size = 2 * n * n + 2
+
+        src, dst, prob = [], [], []
+        for p1 in range(1, n):
+            for p2 in range(1, n):
+                if p1 == p2:
+                    continue
+                for turn in (0, 1):
+                    state = self.state_index(p1, p2, turn)
+                    current, other = (p1, p2) if turn == 0 else (p2, p1)
+                    moves = [dest for _, dest in board.moves_from[current] if dest != other]
+                    if not moves:
+                        src.append(state)
+                        dst.append(self.state_index(p1, p2, 1 - turn))
+                        prob.append(1.0)
+                        continue
+                    for dest in moves:
+                        src.append(state)
+                        if dest == self.ends[turn]:
+                            dst.append(self.win_states[turn])
+                        elif turn == 0:
+                            dst.append(self.state_index(dest, p2, 1))
+                        else:
+                            dst.append(self.state_index(p1, dest, 0))
+                        prob.append(1.0 / len(moves))
+
+        self.src = np.array(src, dtype=np.int64)
+        self.dst = np.array(dst, dtype=np.int64)
+        self.prob = np.array(prob)
+
+    def state_index(self, p1, p2, turn):
+        return (p1 * self.n + p2) * 2 + turn
+
+    def _start(self, first_turn):
+        return self.state_index(self.starts[0], self.starts[1], PLAYERS.index(first_turn))
+
+    def count_sequences(self, k, first_turn='P1'):
+        """Número exacto de partidas legales de k turnos que terminan con victoria de P1 y P2
+        exactamente en el turno k, y de las que siguen en juego tras k turnos"""
+        history = _sequence_dp(self.src, self.dst, self.size, self._start(first_turn), k,
+                               set(self.win_states))
+        final = history[k]
+        return {
+            'P1': final[self.win_states[0]],
+            'P2': final[self.win_states[1]],
+            'in_progress': sum(final) - final[self.win_states[0]] - final[self.win_states[1]],
+        }
+
+    def win_probabilities(self, max_moves, first_turn=None):
+        """Probabilidades exactas de victoria y empate de auto_play con max_moves
+
+        first_turn=None promedia los dos jugadores iniciales, como el sorteo
+        de initialize_game. También devuelve la probabilidad de ganar en cada turno.
+        """
+        if first_turn is None:
+            halves = [self.win_probabilities(max_moves, player) for player in PLAYERS]
+            return {key: (halves[0][key] + halves[1][key]) / 2 for key in halves[0]}
+
+        history = _sequence_dp(self.src, self.dst, self.size, self._start(first_turn), max_moves,
+                               set(self.win_states), weights=self.prob, exact=False)
+        by_turn = np.array([[vector[state] for state in self.win_states] for vector in history])
+        wins = by_turn[1:].sum(axis=0)
+        return {
+            'P1': float(wins[0]),
+            'P2': float(wins[1]),
+            'draw': float(1.0 - wins.sum()),
+            'win_by_turn': by_turn,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_joint_chain(board_size=4):
+    """Cadena conjunta compartida para un tamaño de tablero"""
+    return JointChain(board_size)
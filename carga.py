@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from cliente import GameClient
+from servidor import GameServer
+
+
+def percentile(values, fraction):
+    """Percentil por rango más cercano de una lista ya ordenada"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def _bot(client, games, board_size, max_moves, latencies, rng):
+    """Juega partidas completas como P1 contra el jugador automático del servidor"""
+    for _ in range(games):
+        state = await client.new_game(board_size=board_size, max_moves=max_moves, auto=['P2'])
+        while not state['game_over']:
+            start = time.perf_counter()
+            state = await client.move(state['session'], rng.choice(state['moves']))
+            latencies.append(time.perf_counter() - start)
+        await client.close_game(state['session'])
+
+
+async def run_load(host='127.0.0.1', port=8765, path=None, connections=50, sessions_per_connection=4,
+                   games=20, board_size=4, max_moves=100, seed=0, spawn=True):
+    """Lanza bots concurrentes contra el servidor y mide sesiones/s y latencia por movimiento
+
+    Cada conexión lleva varias sesiones a la vez, así que hay
+    connections * sessions_per_connection partidas abiertas en paralelo.
+    """
+    server = None
+    if spawn:
+        server = GameServer()
+        await server.start(host, port, path)
+
+    rng = random.Random(seed)
+    latencies = []
+    clients = [await GameClient.connect(host, port, path) for _ in range(connections)]
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(_bot(client, games, board_size, max_moves, latencies,
+                                    random.Random(rng.random()))
+                               for client in clients for _ in range(sessions_per_connection)))
+    finally:
+        elapsed = time.perf_counter() - start
+        for client in clients:
+            await client.close()
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    sessions = connections * sessions_per_connection * games
+    return {
+        'sessions': sessions,
+        'concurrent': connections * sessions_per_connection,
+        'moves': len(latencies),
+        'seconds': elapsed,
+        'sessions_per_second': sessions / elapsed,
+        'moves_per_second': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main(argv=None):
+    """Prueba de carga del servidor de partidas"""
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor de partidas")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument('--connections', type=int, default=50)
+    parser.add_argument('--sessions-per-connection', type=int, default=4)
+    parser.add_argument('--games', type=int, default=20, help="partidas por sesión concurrente")
+    parser.add_argument('--board-size', type=int, default=4)
+    parser.add_argument('--max-moves', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--external', action='store_true',
+                        help="usa un servidor ya en marcha en lugar de iniciar uno en este proceso")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(args.host, args.port, args.unix, args.connections,
+                                  args.sessions_per_connection, args.games, args.board_size,
+                                  args.max_moves, args.seed, spawn=not args.external))
+    print(f"Sesiones: {report['sessions']} ({report['concurrent']} simultáneas) en {report['seconds']:.2f} s")
+    print(f"Sesiones/s: {report['sessions_per_second']:,.0f}  Movimientos/s: {report['moves_per_second']:,.0f}")
+    print(f"Latencia por movimiento: p50 {report['p50_ms']:.2f} ms  p99 {report['p99_ms']:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
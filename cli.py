@@ -0,0 +1,183 @@
+import argparse
+import random
+import sys
+
+from modelo import MOVE_SYMBOLS, parse_sequence
+from motor import GameEngine, default_players
+
+
+def build_parser():
+    """Define los argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Juego de Movimientos en Tablero de Ajedrez sin menú interactivo")
+    parser.add_argument('--mode', choices=['auto', 'manual', 'menu'], default='auto',
+                        help="modo de juego; 'menu' abre el menú interactivo original")
+    parser.add_argument('--max-moves', type=int, default=None,
+                        help="número máximo de movimientos (3-100)")
+    parser.add_argument('--moves', help="cadena de movimientos para el modo manual, ej. U,D,L,R,UL,DR")
+    parser.add_argument('--moves-file', help="archivo con una cadena de movimientos por línea")
+    parser.add_argument('--seed', type=int, default=None, help="semilla del generador aleatorio")
+    parser.add_argument('--games', type=int, default=1, help="número de partidas a jugar")
+    parser.add_argument('--board-size', type=int, default=4, help="tamaño del tablero NxN")
+    parser.add_argument('--players', type=int, default=2,
+                        help="número de jugadores (hasta 2N); con más de dos, turnos en ronda")
+    parser.add_argument('--output', help="archivo JSONL donde añadir el registro de cada partida")
+    parser.add_argument('--replay', metavar='JSONL',
+                        help="reconstruye una partida de un registro JSONL y genera sus archivos de salida")
+    parser.add_argument('--game-id', type=int, default=0, help="partida a reconstruir con --replay")
+    parser.add_argument('--export', metavar='PATH',
+                        help="exporta la última partida (o la de --replay) a .gif, .mp4 o un directorio de PNG")
+    parser.add_argument('--fps', type=float, default=2, help="cuadros por segundo de --export")
+    parser.add_argument('--edge-stats', help="archivo .npz donde guardar los contadores acumulados por arista")
+    parser.add_argument('--verbose', action='store_true', help="imprime cada movimiento en modo sin ventana")
+    display = parser.add_mutually_exclusive_group()
+    display.add_argument('--headless', dest='visual', action='store_false', default=False,
+                         help="juega sin ventana (por defecto)")
+    display.add_argument('--visual', dest='visual', action='store_true',
+                         help="muestra el tablero y el NFA con matplotlib")
+    parser.add_argument('--profile', action='store_true',
+                        help="mide el tiempo por fase y muestra un resumen al terminar")
+    parser.add_argument('--trace', help="guarda una traza de eventos (formato Chrome Trace) en este archivo")
+    parser.add_argument('--tick', type=float, default=1.0,
+                        help="segundos por paso de la cuenta regresiva en modo visual (0 = sin espera)")
+    parser.add_argument('--ai', nargs='+', choices=['P1', 'P2'], default=[],
+                        help="jugadores controlados por la IA de búsqueda")
+    parser.add_argument('--ai-budget', type=float, default=100,
+                        help="milisegundos de búsqueda por movimiento de la IA")
+    return parser
+
+
+def iter_games(args):
+    """Genera (modo, max_moves, secuencia) para cada partida pedida"""
+    if args.mode == 'auto':
+        for _ in range(args.games):
+            yield 'auto', args.max_moves or 10, None
+        return
+
+    if args.moves_file:
+        with open(args.moves_file) as f:
+            for line in f:
+                sequence = parse_sequence(line)
+                if sequence:
+                    yield 'manual', args.max_moves or len(sequence), sequence
+        return
+
+    sequence = parse_sequence(args.moves) if args.moves else None
+    for _ in range(args.games):
+        if sequence:
+            yield 'manual', args.max_moves or len(sequence), sequence
+        else:
+            yield 'manual', args.max_moves or 10, None
+
+
+def play(game, mode, max_moves, sequence):
+    """Juega una partida en el modo indicado"""
+    game.initialize_game(mode=mode, max_moves=max_moves, move_sequence=sequence)
+    if mode == 'auto':
+        game.auto_play()
+    else:
+        game.manual_play()
+
+
+def export(game, path, fps):
+    """Exporta una partida terminada; el stack gráfico se importa solo aquí"""
+    from exportar import export_game
+    export_game(game, path, fps=fps)
+    print(f"Partida exportada a {path}")
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    args = build_parser().parse_args(argv)
+
+    if args.mode == 'menu':
+        import Tablero
+        Tablero.main()
+        return 0
+
+    if args.replay:
+        from registro import find_record, replay_record
+        game = replay_record(find_record(args.replay, args.game_id))
+        game.generate_output_files()
+        print(f"Partida {args.game_id} (semilla {game.seed}): ganador {game.winner}, "
+              f"{game.current_move_count} movimientos. Archivos en la carpeta 'output'.")
+        if args.export:
+            export(game, args.export, args.fps)
+        return 0
+
+    invalid = [move for move in parse_sequence(args.moves or '') if move not in MOVE_SYMBOLS]
+    if invalid:
+        print(f"Movimientos no reconocidos: {', '.join(invalid)}", file=sys.stderr)
+        return 2
+
+    if args.players != 2 and (args.ai or args.edge_stats):
+        print("--ai y --edge-stats solo admiten partidas de dos jugadores", file=sys.stderr)
+        return 2
+    try:
+        players = default_players(args.board_size, args.players)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    # El stack gráfico solo se importa cuando se pide el modo visual
+    if args.visual:
+        import matplotlib.pyplot as plt
+        from Tablero import ChessBoardGame
+        game = ChessBoardGame(board_size=args.board_size, tick=args.tick, players=players)
+    else:
+        game = GameEngine(board_size=args.board_size, verbose=args.verbose, players=players)
+
+    if args.ai:
+        from ia import SearchPlayer
+        for player in args.ai:
+            game.set_ai_player(player, SearchPlayer(time_budget_ms=args.ai_budget))
+
+    profiler = None
+    if args.profile or args.trace:
+        from instrumentacion import Profiler
+        profiler = Profiler(trace_path=args.trace, report_every_game=False)
+        game.profiler = profiler
+
+    writer = None
+    if args.output:
+        from registro import GameRecordWriter
+        writer = GameRecordWriter(args.output, profiler=game.profiler)
+        game.add_observer(writer)
+
+    edge_stats = None
+    if args.edge_stats:
+        from estadisticas import EdgeStats
+        edge_stats = EdgeStats(args.board_size)
+        game.add_observer(edge_stats)
+
+    results = {player: 0 for player in game.players}
+    results[None] = 0
+    total = 0
+    try:
+        for mode, max_moves, sequence in iter_games(args):
+            play(game, mode, max_moves, sequence)
+            results[game.winner] += 1
+            total += 1
+    finally:
+        if writer is not None:
+            writer.close()
+        if edge_stats is not None:
+            edge_stats.save(args.edge_stats)
+
+    wins = "  ".join(f"Gana {player}: {results[player]}" for player in game.players)
+    print(f"Partidas: {total}  {wins}  Sin ganador: {results[None]}")
+    if profiler is not None:
+        profiler.report()
+    if args.export and total:
+        export(game, args.export, args.fps)
+
+    if args.visual:
+        plt.show()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
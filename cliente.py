@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import itertools
+import sys
+
+from registro import dumps_line, loads_line
+
+
+class GameClient:
+    def __init__(self, reader, writer):
+        """Cliente del servidor de partidas: peticiones con id y cola de actualizaciones"""
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+        self.pending = {}
+        # Estados enviados por el servidor sin petición (jugadores automáticos, tiempos agotados)
+        self.updates = asyncio.Queue()
+        self.listener = asyncio.ensure_future(self._listen())
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=8765, path=None):
+        """Se conecta por TCP o, si se da path, por un socket Unix"""
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _listen(self):
+        """Reparte cada línea recibida a su petición o a la cola de actualizaciones"""
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                message = loads_line(line)
+                future = self.pending.pop(message.get('id'), None)
+                if future is not None:
+                    future.set_result(message)
+                else:
+                    self.updates.put_nowait(message)
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Conexión cerrada por el servidor"))
+            self.pending.clear()
+
+    async def request(self, op, **fields):
+        """Envía una petición y espera su respuesta; los errores del servidor se elevan como ValueError"""
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        self.writer.write(dumps_line({'op': op, 'id': request_id, **fields}))
+        await self.writer.drain()
+        response = await future
+        if response.get('type') == 'error':
+            raise ValueError(response['message'])
+        return response
+
+    async def new_game(self, **options):
+        return await self.request('new', **options)
+
+    async def move(self, session, move, player=None):
+        fields = {'session': session, 'move': move}
+        if player is not None:
+            fields['player'] = player
+        return await self.request('move', **fields)
+
+    async def close_game(self, session):
+        return await self.request('close', session=session)
+
+    async def close(self):
+        self.listener.cancel()
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def show_state(state):
+    """Imprime un estado de forma legible"""
+    positions = "  ".join(f"{player}: {pos}" for player, pos in state['positions'].items())
+    print(f"Movimiento {state['move_count']}/{state['max_moves']}  {positions}  Turno: {state['turn']}")
+    if state['game_over']:
+        if state['winner']:
+            print(f"¡Jugador {state['winner']} ha ganado!")
+        else:
+            print("Juego terminado sin ganador (límite de movimientos alcanzado).")
+    else:
+        print(f"Movimientos válidos: {', '.join(state['moves'])}")
+
+
+async def play_interactive(args):
+    """Juega como P1 contra el jugador automático del servidor desde la terminal"""
+    client = await GameClient.connect(args.host, args.port, args.unix)
+    loop = asyncio.get_running_loop()
+    try:
+        state = await client.new_game(board_size=args.board_size, max_moves=args.max_moves, auto=['P2'])
+        session = state['session']
+        while True:
+            show_state(state)
+            if state['game_over']:
+                break
+            move = (await loop.run_in_executor(None, input, "Movimiento: ")).strip().upper()
+            try:
+                state = await client.move(session, move)
+            except ValueError as error:
+                print(error)
+        await client.close_game(session)
+    finally:
+        await client.close()
+
+
+def main(argv=None):
+    """Cliente interactivo de terminal"""
+    parser = argparse.ArgumentParser(description="Cliente de terminal para el servidor de partidas")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument('--board-size', type=int, default=4)
+    parser.add_argument('--max-moves', type=int, default=10)
+    args = parser.parse_args(argv)
+    asyncio.run(play_interactive(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
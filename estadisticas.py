@@ -0,0 +1,205 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from estado import PLAYERS
+from modelo import MOVE_INDEX, MOVE_SYMBOLS, NUM_MOVES, get_board_model
+from motor import GameEngine, GameObserver, sequence_seed
+
+METRICS = ('available', 'taken', 'winning')
+
+
+class EdgeStats(GameObserver):
+    """Contadores acumulados por arista (jugador, posición, movimiento) a lo largo de muchas partidas
+
+    Cada contador es un arreglo indexado como la tabla de BoardModel
+    (pos * NUM_MOVES + movimiento), así que actualizarlo es O(1) por
+    movimiento y dos estadísticas se combinan sumando arreglos.
+    """
+
+    def __init__(self, board_size=4):
+        self.board_size = board_size
+        self.board = get_board_model(board_size)
+        shape = (len(PLAYERS), (self.board.num_positions + 1) * NUM_MOVES)
+        # available: la arista era un movimiento válido; taken: se jugó;
+        # winning: se jugó en una partida que ese jugador terminó ganando
+        self.available = np.zeros(shape, dtype=np.int64)
+        self.taken = np.zeros(shape, dtype=np.int64)
+        self.winning = np.zeros(shape, dtype=np.int64)
+        self.games = 0
+        self.wins = np.zeros(len(PLAYERS), dtype=np.int64)
+
+    def on_turn_end(self, game):
+        """Cuenta las aristas disponibles y la jugada del turno que acaba de terminar"""
+        player, move = game.turn_log[-1]
+        p = PLAYERS.index(player)
+        if move is None:
+            from_pos = game.positions[player]['current']
+        else:
+            from_pos = game.moves_history[player][-1][0]
+            self.taken[p, from_pos * NUM_MOVES + MOVE_INDEX[move]] += 1
+
+        other_pos = game.positions[PLAYERS[1 - p]]['current']
+        available = self.available[p]
+        for index, dest in self.board.moves_from[from_pos]:
+            if dest != other_pos:
+                available[from_pos * NUM_MOVES + index] += 1
+
+    def on_game_over(self, game):
+        """Acredita al ganador todas las aristas que jugó en la partida"""
+        self.games += 1
+        if game.winner is None:
+            return
+        p = PLAYERS.index(game.winner)
+        self.wins[p] += 1
+        winning = self.winning[p]
+        for from_pos, _, move in game.moves_history[game.winner]:
+            winning[from_pos * NUM_MOVES + MOVE_INDEX[move]] += 1
+
+    def merge(self, other):
+        """Suma los contadores de otra estadística del mismo tablero"""
+        if other.board_size != self.board_size:
+            raise ValueError("Solo se pueden combinar estadísticas del mismo tamaño de tablero")
+        self.available += other.available
+        self.taken += other.taken
+        self.winning += other.winning
+        self.wins += other.wins
+        self.games += other.games
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __getstate__(self):
+        # El modelo de tablero se reconstruye desde la caché al deserializar
+        state = self.__dict__.copy()
+        del state['board']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.board = get_board_model(self.board_size)
+
+    def counts(self, player, metric='taken'):
+        """Matriz (posición, movimiento) de un contador; la fila 0 queda sin usar"""
+        if metric not in METRICS:
+            raise ValueError(f"Métrica desconocida: {metric}")
+        return getattr(self, metric)[PLAYERS.index(player)].reshape(-1, NUM_MOVES)
+
+    def win_rate(self, player):
+        """Fracción de veces que jugar cada arista acabó en victoria (NaN si nunca se jugó)"""
+        taken = self.counts(player, 'taken')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.counts(player, 'winning') / taken
+
+    def top_edges(self, player, metric='taken', n=10):
+        """Las n aristas con mayor conteo: [(desde, movimiento, destino, conteo)]"""
+        flat = getattr(self, metric)[PLAYERS.index(player)]
+        order = np.argsort(flat, kind='stable')[::-1][:n]
+        table = self.board.table
+        return [(int(i) // NUM_MOVES, MOVE_SYMBOLS[int(i) % NUM_MOVES], table[int(i)], int(flat[i]))
+                for i in order if flat[i]]
+
+    def save(self, path):
+        """Guarda los contadores en un archivo .npz"""
+        np.savez_compressed(path, board_size=self.board_size, games=self.games, wins=self.wins,
+                            available=self.available, taken=self.taken, winning=self.winning)
+
+    @classmethod
+    def load(cls, path):
+        """Carga contadores guardados con save"""
+        with np.load(path) as data:
+            stats = cls(int(data['board_size']))
+            stats.games = int(data['games'])
+            stats.wins = data['wins']
+            stats.available = data['available']
+            stats.taken = data['taken']
+            stats.winning = data['winning']
+        return stats
+
+
+def _collect_chunk(task):
+    """Juega un bloque de partidas en un proceso trabajador y devuelve sus contadores"""
+    board_size, max_moves, mode, seed, n_games = task
+    random.seed(seed)
+    game = GameEngine(board_size=board_size)
+    stats = EdgeStats(board_size)
+    game.add_observer(stats)
+    for _ in range(n_games):
+        game.initialize_game(mode=mode, max_moves=max_moves)
+        if mode == 'auto':
+            game.auto_play()
+        else:
+            game.manual_play()
+    return stats
+
+
+def collect_edge_stats(n_games, board_size=4, max_moves=10, mode='auto', seed=0, workers=None,
+                       chunk_size=2000):
+    """Juega n_games partidas repartidas entre procesos y combina sus contadores"""
+    workers = workers or os.cpu_count() or 1
+    tasks = []
+    for i, start in enumerate(range(0, n_games, chunk_size)):
+        tasks.append((board_size, max_moves, mode, sequence_seed(seed, i), min(chunk_size, n_games - start)))
+
+    total = EdgeStats(board_size)
+    if workers == 1:
+        for task in tasks:
+            total.merge(_collect_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for stats in pool.map(_collect_chunk, tasks):
+                total.merge(stats)
+    return total
+
+
+def plot_edge_stats(stats, player='P1', metric='taken', ax=None):
+    """Dibuja los totales: mapa de calor por casilla y aristas con grosor según el conteo
+
+    Todas las aristas se dibujan con una sola LineCollection construida a
+    partir de los arreglos, sin grafo de networkx ni redibujos por partida.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    if ax is None:
+        _, ax = plt.subplots(figsize=(7, 7))
+
+    board = stats.board
+    size = stats.board_size
+    counts = stats.counts(player, metric)
+
+    # Mapa de calor: total de la métrica por casilla de origen
+    heat = counts[1:].sum(axis=1).reshape(size, size)
+    image = ax.imshow(heat, cmap='YlOrRd', extent=(0, size, 0, size), origin='upper')
+    plt.colorbar(image, ax=ax, fraction=0.046, pad=0.04, label=f"{metric} por casilla")
+
+    def center(pos):
+        row, col = board.position_to_coords(pos)
+        return col + 0.5, size - 0.5 - row
+
+    segments, weights = [], []
+    for pos in range(1, board.num_positions + 1):
+        x, y = center(pos)
+        for index, dest in board.moves_from[pos]:
+            count = counts[pos, index]
+            if count:
+                dx, dy = center(dest)
+                # Se acorta la arista para que no tape la casilla de destino
+                segments.append(((x, y), (x + (dx - x) * 0.8, y + (dy - y) * 0.8)))
+                weights.append(count)
+
+    if weights:
+        weights = np.asarray(weights, dtype=float)
+        scale = weights / weights.max()
+        lines = LineCollection(segments, linewidths=0.5 + 5 * scale, colors='black', alpha=0.6)
+        ax.add_collection(lines)
+
+    ax.set_xlim(0, size)
+    ax.set_ylim(0, size)
+    ax.set_xticks(range(size + 1))
+    ax.set_yticks(range(size + 1))
+    ax.set_title(f"Aristas de {player} ({metric}) en {stats.games} partidas")
+    return ax
@@ -0,0 +1,128 @@
+from modelo import INVALID, MOVE_INDEX, MOVE_SYMBOLS, NUM_MOVES, get_board_model
+
+PLAYERS = ('P1', 'P2')
+PASS = None
+NO_WINNER = -1
+
+
+class GameState:
+    """Estado compacto de una partida: dos posiciones, turno, movimientos y ganador
+
+    Los jugadores son 0 (P1) y 1 (P2) y los movimientos son índices de
+    MOVE_SYMBOLS. apply devuelve una ficha de deshacer (la posición previa,
+    o 0 si se pasó el turno) que undo usa para revertir en O(1).
+    """
+    __slots__ = ('board', 'table', 'ends', 'p1', 'p2', 'turn', 'move_count', 'max_moves', 'winner')
+
+    def __init__(self, board, p1, p2, turn, move_count=0, max_moves=100, winner=NO_WINNER, ends=None):
+        self.board = board
+        self.table = board.table
+        last = board.num_positions
+        self.ends = ends if ends is not None else (last, last - board.board_size + 1)
+        self.p1 = p1
+        self.p2 = p2
+        self.turn = turn
+        self.move_count = move_count
+        # Mismo rango que initialize_game: key reserva 101 valores para los movimientos restantes
+        self.max_moves = min(max(max_moves, 3), 100)
+        self.winner = winner
+
+    @classmethod
+    def initial(cls, board_size=4, first_turn=0, max_moves=100):
+        """Estado inicial con las piezas en las esquinas de inicio"""
+        board = get_board_model(board_size)
+        return cls(board, 1, board_size, first_turn, max_moves=max_moves)
+
+    @classmethod
+    def from_engine(cls, game):
+        """Extrae el estado compacto de un motor de juego de dos jugadores"""
+        if game.players != list(PLAYERS):
+            raise ValueError("GameState solo representa partidas de dos jugadores (P1 y P2)")
+        return cls(game.board, game.positions['P1']['current'], game.positions['P2']['current'],
+                   PLAYERS.index(game.turn), game.current_move_count, game.max_moves,
+                   PLAYERS.index(game.winner) if game.winner else NO_WINNER,
+                   (game.positions['P1']['end'], game.positions['P2']['end']))
+
+    def copy(self):
+        """Copia barata que comparte el modelo de tablero"""
+        return GameState(self.board, self.p1, self.p2, self.turn, self.move_count,
+                         self.max_moves, self.winner, self.ends)
+
+    @property
+    def is_terminal(self):
+        """La partida terminó por victoria o por límite de movimientos"""
+        return self.winner != NO_WINNER or self.move_count >= self.max_moves
+
+    @property
+    def moves_left(self):
+        return self.max_moves - self.move_count
+
+    @property
+    def occupancy(self):
+        """Bitboard con un bit por casilla ocupada"""
+        return (1 << self.p1) | (1 << self.p2)
+
+    def key(self):
+        """Clave entera única de (P1, P2, turno, movimientos restantes, ganador)"""
+        n = self.board.num_positions + 1
+        return ((((self.p1 * n + self.p2) * 2 + self.turn) * 101 + self.moves_left) * 3
+                + self.winner + 1)
+
+    def legal_moves(self):
+        """Índices de los movimientos válidos del jugador en turno (regla de colisión incluida)"""
+        if self.turn == 0:
+            current, other = self.p1, self.p2
+        else:
+            current, other = self.p2, self.p1
+        return [move for move, dest in self.board.moves_from[current] if dest != other]
+
+    def apply(self, move):
+        """Aplica un movimiento válido (o PASS) y devuelve la ficha para deshacerlo"""
+        turn = self.turn
+        if move is PASS:
+            self.turn = 1 - turn
+            self.move_count += 1
+            return INVALID
+
+        if turn == 0:
+            previous = self.p1
+            dest = self.p1 = self.table[previous * NUM_MOVES + move]
+        else:
+            previous = self.p2
+            dest = self.p2 = self.table[previous * NUM_MOVES + move]
+
+        # Igual que make_move: una victoria no consume movimiento ni cambia el turno
+        if dest == self.ends[turn]:
+            self.winner = turn
+        else:
+            self.move_count += 1
+            self.turn = 1 - turn
+        return previous
+
+    def undo(self, token):
+        """Revierte el último apply a partir de su ficha"""
+        if self.winner != NO_WINNER:
+            self.winner = NO_WINNER
+            mover = self.turn
+        else:
+            self.move_count -= 1
+            self.turn = mover = 1 - self.turn
+            if token == INVALID:
+                return
+
+        if mover == 0:
+            self.p1 = token
+        else:
+            self.p2 = token
+
+    def apply_symbol(self, symbol):
+        """Aplica un movimiento en notación U/D/L/R/UL/UR/DL/DR o None para pasar"""
+        return self.apply(PASS if symbol is None else MOVE_INDEX[symbol])
+
+    def legal_symbols(self):
+        """Movimientos válidos en notación de símbolos"""
+        return [MOVE_SYMBOLS[move] for move in self.legal_moves()]
+
+    def __repr__(self):
+        return (f"GameState(P1={self.p1}, P2={self.p2}, turno={PLAYERS[self.turn]}, "
+                f"movimientos={self.move_count}/{self.max_moves}, ganador={self.winner})")
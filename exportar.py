@@ -0,0 +1,116 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from motor import GameEngine
+from renderizador import IncrementalRenderer
+
+FRAME_PATTERN = 'frame_%04d.png'
+
+
+def _replay_engine(board_size, max_moves, first_turn, players=None):
+    """Crea un motor en el estado inicial de la partida grabada"""
+    engine = GameEngine(board_size=board_size, players=players)
+    engine.reset()
+    engine.max_moves = max_moves
+    engine.turn = first_turn
+    return engine
+
+
+def _result_text(engine):
+    """Texto final igual al que muestra la vista en vivo"""
+    if engine.winner:
+        return f"¡Jugador {engine.winner} ha ganado!"
+    return "Juego terminado sin ganador (límite de movimientos alcanzado)."
+
+
+def _render_range(args):
+    """Tarea de un proceso: reproduce hasta el primer cuadro y dibuja un rango consecutivo"""
+    board_size, players, max_moves, first_turn, turn_log, start, end, frame_dir, dpi = args
+    engine = _replay_engine(board_size, max_moves, first_turn, players)
+
+    # Lienzo Agg sin pantalla; el primer cuadro es un dibujo completo y los
+    # siguientes solo añaden las flechas y aristas nuevas sobre el fondo
+    fig = Figure(figsize=(14, 7), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    renderer = IncrementalRenderer(engine, fig)
+    # El cuadro 0 es un dibujo completo. Los turnos anteriores a start solo
+    # preparan sus artistas, y el primer render los añade al fondo en el mismo
+    # orden que con un solo proceso, así que los cuadros no dependen del reparto
+    renderer.render()
+    for player, move in turn_log[:start]:
+        engine.play_turn(player, move)
+        renderer.queue_history()
+
+    for frame in range(start, end):
+        if frame > start:
+            engine.play_turn(*turn_log[frame - 1])
+        if frame == len(turn_log):
+            renderer.show_result(_result_text(engine))
+        elif frame > 0:
+            renderer.render()
+        image = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba())
+        image.save(os.path.join(frame_dir, FRAME_PATTERN % frame), compress_level=1)
+    return end - start
+
+
+def render_frames(game, frame_dir, workers=None, dpi=80):
+    """Dibuja en paralelo un PNG por turno de la partida grabada en frame_dir"""
+    os.makedirs(frame_dir, exist_ok=True)
+    n_frames = len(game.turn_log) + 1
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, -(-n_frames // (workers * 2)))
+    tasks = [(game.board_size, game.player_specs, game.max_moves, game.first_turn, list(game.turn_log),
+              start, min(start + chunk, n_frames), frame_dir, dpi)
+             for start in range(0, n_frames, chunk)]
+
+    if workers == 1:
+        rendered = sum(map(_render_range, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = sum(pool.map(_render_range, tasks))
+    return [os.path.join(frame_dir, FRAME_PATTERN % i) for i in range(rendered)]
+
+
+def _assemble_gif(frames, path, fps):
+    """Une los cuadros en un GIF animado"""
+    images = [Image.open(frame) for frame in frames]
+    images[0].save(path, save_all=True, append_images=images[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
+def _assemble_mp4(frame_dir, path, fps):
+    """Une los cuadros en un MP4 con ffmpeg"""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("Se requiere ffmpeg para exportar MP4.")
+
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-framerate', str(fps),
+                    '-i', os.path.join(frame_dir, FRAME_PATTERN),
+                    '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', path],
+                   check=True)
+
+
+def export_game(game, path, fps=2, workers=None, dpi=80):
+    """Exporta la partida grabada a GIF, MP4 o una secuencia PNG sin pantalla
+
+    El formato se elige por la extensión de path (.gif o .mp4); cualquier otra
+    ruta se trata como el directorio donde se guardan los cuadros numerados.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.gif', '.mp4'):
+        return render_frames(game, path, workers, dpi)
+
+    with tempfile.TemporaryDirectory() as frame_dir:
+        frames = render_frames(game, frame_dir, workers, dpi)
+        if extension == '.gif':
+            _assemble_gif(frames, path, fps)
+        else:
+            _assemble_mp4(frame_dir, path, fps)
+    return path
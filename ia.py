@@ -0,0 +1,178 @@
+import time
+from functools import lru_cache
+
+from estado import NO_WINNER, PASS, PLAYERS, GameState
+from modelo import MOVE_SYMBOLS, NUM_MOVES
+
+WIN_SCORE = 10000
+# Por encima de este valor absoluto una puntuación es una victoria o derrota forzada
+MATE_BOUND = WIN_SCORE - 1000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    """Se agotó el presupuesto de tiempo de la búsqueda"""
+
+
+def _to_table(value, ply):
+    """Pasa una puntuación de victoria de relativa a la raíz a relativa al nodo"""
+    if value >= MATE_BOUND:
+        return value + ply
+    if value <= -MATE_BOUND:
+        return value - ply
+    return value
+
+
+def _from_table(value, ply):
+    """Inversa de _to_table: la distancia a la victoria vuelve a contarse desde la raíz"""
+    if value >= MATE_BOUND:
+        return value - ply
+    if value <= -MATE_BOUND:
+        return value + ply
+    return value
+
+
+@lru_cache(maxsize=None)
+def goal_distances(board, goal):
+    """Distancia en movimientos de rey de cada casilla a goal: distances[pos], O(N²) por meta"""
+    goal_row, goal_col = board.position_to_coords(goal)
+    coords = (board.position_to_coords(pos) for pos in range(1, board.num_positions + 1))
+    return (0,) + tuple(max(abs(row - goal_row), abs(col - goal_col)) for row, col in coords)
+
+
+class SearchPlayer:
+    def __init__(self, time_budget_ms=100, max_depth=64, table_size=1 << 20):
+        """Jugador por búsqueda alfa-beta con profundización iterativa y tabla de transposición"""
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.table = {}
+        self.nodes = 0
+        self.depth_reached = 0
+        self.deadline = 0.0
+        self.distances = None
+
+    def choose_move(self, game, player):
+        """Mejor movimiento para player dentro del presupuesto, o None si debe pasar"""
+        state = GameState.from_engine(game)
+        state.turn = PLAYERS.index(player)
+        move = self.search(state)
+        return None if move is PASS else MOVE_SYMBOLS[move]
+
+    def search(self, state):
+        """Índice del mejor movimiento encontrado para el jugador en turno del estado"""
+        moves = state.legal_moves()
+        if not moves:
+            return PASS
+
+        self.deadline = time.perf_counter() + self.time_budget_ms / 1000
+        self.nodes = 0
+        self.depth_reached = 0
+        if len(self.table) > self.table_size:
+            self.table.clear()
+
+        # Solo hacen falta las distancias a las dos metas, no entre todos los pares
+        self.distances = tuple(goal_distances(state.board, goal) for goal in state.ends)
+        best = self._order(state, moves, None)[0]
+        state = state.copy()
+        for depth in range(1, min(self.max_depth, state.moves_left) + 1):
+            try:
+                score, move = self._root(state, moves, depth)
+            except _Timeout:
+                break
+            best = move
+            self.depth_reached = depth
+            # Una victoria o derrota forzada no cambia al buscar más profundo
+            if abs(score) >= WIN_SCORE - self.max_depth:
+                break
+        return best
+
+    def _order(self, state, moves, first):
+        """Ordena los movimientos: primero el de la tabla, luego los que acercan a la meta"""
+        current = state.p1 if state.turn == 0 else state.p2
+        goal = self.distances[state.turn]
+        table = state.table
+        ordered = sorted(moves, key=lambda move: goal[table[current * NUM_MOVES + move]])
+        if first is not None and first in ordered:
+            ordered.remove(first)
+            ordered.insert(0, first)
+        return ordered
+
+    def _evaluate(self, state):
+        """Heurística desde el jugador en turno: ventaja en distancia a la meta"""
+        d1 = self.distances[0][state.p1]
+        d2 = self.distances[1][state.p2]
+        return d2 - d1 if state.turn == 0 else d1 - d2
+
+    def _root(self, state, moves, depth):
+        entry = self.table.get(state.key())
+        ordered = self._order(state, moves, entry[3] if entry else None)
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move = ordered[0]
+        for move in ordered:
+            score = self._child_score(state, move, depth, 1, alpha, beta)
+            if score > alpha:
+                alpha, best_move = score, move
+        # La raíz cuenta como ply 1: sus hijos se puntúan con ply=1
+        self.table[state.key()] = (depth, _to_table(alpha, 1), EXACT, best_move)
+        return alpha, best_move
+
+    def _child_score(self, state, move, depth, ply, alpha, beta):
+        """Valor de aplicar move para el jugador que mueve"""
+        token = state.apply(move)
+        try:
+            if state.winner != NO_WINNER:
+                return WIN_SCORE - ply
+            if state.move_count >= state.max_moves:
+                return 0
+            return -self._negamax(state, depth - 1, ply + 1, -beta, -alpha)
+        finally:
+            state.undo(token)
+
+    def _negamax(self, state, depth, ply, alpha, beta):
+        self.nodes += 1
+        if not self.nodes & 255 and time.perf_counter() > self.deadline:
+            raise _Timeout()
+
+        if depth <= 0:
+            return self._evaluate(state)
+
+        key = state.key()
+        entry = self.table.get(key)
+        first = None
+        if entry is not None:
+            entry_depth, value, flag, first = entry
+            # La tabla persiste entre búsquedas: las victorias se guardan relativas al nodo
+            value = _from_table(value, ply)
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value >= beta:
+                    return value
+                if flag == UPPER and value <= alpha:
+                    return value
+
+        moves = state.legal_moves()
+        if not moves:
+            # Sin movimientos válidos el jugador pasa el turno
+            return self._child_score(state, PASS, depth, ply, alpha, beta)
+
+        original_alpha = alpha
+        best_score, best_move = -WIN_SCORE - 1, None
+        for move in self._order(state, moves, first):
+            score = self._child_score(state, move, depth, ply, alpha, beta)
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (depth, _to_table(best_score, ply), flag, best_move)
+        return best_score
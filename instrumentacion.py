@@ -0,0 +1,135 @@
+import json
+import time
+
+
+class _Phase:
+    """Contexto que mide una fase y la acumula en el perfilador"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start, self.start)
+        return False
+
+
+class _NullPhase:
+    """Contexto vacío compartido por el perfilador desactivado"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullProfiler:
+    """Perfilador desactivado: todas las operaciones son no-ops"""
+    enabled = False
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def count(self, name, n=1):
+        pass
+
+    def add_time(self, name, seconds, start=None):
+        pass
+
+    def end_game(self):
+        pass
+
+    def report(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, trace_path=None, print_summary=True, report_every_game=True):
+        """Acumula tiempos por fase y contadores; opcionalmente guarda una traza de eventos"""
+        self.trace_path = trace_path
+        self.print_summary = print_summary
+        self.report_every_game = report_every_game
+        self.origin = time.perf_counter()
+        self.totals = {}
+        self.calls = {}
+        self.maxima = {}
+        self.counters = {}
+        self.events = [] if trace_path else None
+
+    def phase(self, name):
+        """Contexto que mide el tiempo de una fase: with profiler.phase('make_move'): ..."""
+        return _Phase(self, name)
+
+    def count(self, name, n=1):
+        """Incrementa un contador"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name, seconds, start=None):
+        """Registra una duración para una fase"""
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if seconds > self.maxima.get(name, 0.0):
+            self.maxima[name] = seconds
+        if self.events is not None:
+            if start is None:
+                start = time.perf_counter() - seconds
+            self.events.append((name, start - self.origin, seconds))
+
+    def summary(self):
+        """Resumen por fase (llamadas, total, media, máximo) y contadores"""
+        phases = {}
+        for name, total in self.totals.items():
+            calls = self.calls[name]
+            phases[name] = {'calls': calls, 'total': total, 'mean': total / calls,
+                            'max': self.maxima[name]}
+        return {'phases': phases, 'counters': dict(self.counters)}
+
+    def format_summary(self):
+        """Texto legible del resumen, ordenado por tiempo total"""
+        data = self.summary()
+        lines = ["Perfil de la partida:"]
+        for name, stats in sorted(data['phases'].items(), key=lambda item: -item[1]['total']):
+            lines.append(f"  {name:<18} {stats['calls']:>8} llamadas  {stats['total'] * 1000:>10.2f} ms  "
+                         f"media {stats['mean'] * 1e6:>9.1f} µs  máx {stats['max'] * 1000:>8.2f} ms")
+        for name, value in sorted(data['counters'].items()):
+            lines.append(f"  {name:<18} {value:>8}")
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """Guarda los eventos en formato Chrome Trace (chrome://tracing, Perfetto)"""
+        events = [{'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': seconds * 1e6,
+                   'pid': 0, 'tid': 0}
+                  for name, start, seconds in self.events or ()]
+        now = (time.perf_counter() - self.origin) * 1e6
+        for name, value in self.counters.items():
+            events.append({'name': name, 'ph': 'C', 'ts': now, 'pid': 0, 'args': {name: value}})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'summary': self.summary()}, f)
+
+    def end_game(self):
+        """Marca el final de una partida y exporta el resumen si así se configuró"""
+        self.count('games')
+        if self.report_every_game:
+            self.report()
+
+    def report(self):
+        """Exporta el resumen y la traza acumulados"""
+        if self.print_summary:
+            print(self.format_summary())
+        if self.trace_path:
+            self.write_trace(self.trace_path)
@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from modelo import parse_sequence
+from motor import GameEngine, sequence_seed
+from registro import dumps_line
+
+# Motor reutilizado por todas las partidas de un proceso trabajador
+_engine = None
+
+
+def iter_sequences(path):
+    """Genera (índice, secuencia) por cada línea no vacía del archivo, sin cargarlo entero"""
+    index = 0
+    with open(path) as f:
+        for line in f:
+            sequence = parse_sequence(line)
+            if sequence:
+                yield index, sequence
+                index += 1
+
+
+def evaluate_sequence(game, sequence, seed, max_moves=None):
+    """Juega una partida con su propia semilla y devuelve su resultado
+
+    Con secuencia se usa la semántica de manual_play; sin ella (None) la
+    partida es automática, como auto_play.
+    """
+    if sequence is None:
+        game.initialize_game(mode='auto', max_moves=max_moves or 10, seed=seed)
+        game.auto_play()
+    else:
+        game.initialize_game(mode='manual', max_moves=max_moves or len(sequence),
+                             move_sequence=sequence, seed=seed)
+        game.manual_play()
+    return {
+        'winner': game.winner,
+        'first_turn': game.first_turn,
+        'moves': game.current_move_count,
+        'reconfigured': [list(entry) for entry in game.reconfigured_moves],
+    }
+
+
+def _evaluate_chunk(task):
+    """Evalúa un bloque de partidas en un proceso trabajador; devuelve líneas JSONL, conteos y el siguiente índice"""
+    global _engine
+    board_size, max_moves, base_seed, items = task
+    if _engine is None or _engine.board_size != board_size:
+        _engine = GameEngine(board_size=board_size)
+
+    lines = []
+    wins = {'P1': 0, 'P2': 0, None: 0}
+    for index, sequence in items:
+        seed = sequence_seed(base_seed, index)
+        result = evaluate_sequence(_engine, sequence, seed, max_moves)
+        wins[result['winner']] += 1
+        lines.append(dumps_line({'index': index, 'seed': seed, **result}))
+    return b''.join(lines), wins, items[-1][0] + 1
+
+
+def _chunks(items, size):
+    """Agrupa un iterable en listas de tamaño size"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_checkpoint(path):
+    """Lee un punto de control, o None si no existe"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    """Escribe el punto de control de forma atómica: nunca queda a medio escribir"""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def run_batch(items, output, config, workers=None, chunk_size=500, checkpoint=None, checkpoint_every=20):
+    """Evalúa (índice, secuencia) en paralelo y escribe un resultado JSONL por partida
+
+    Los bloques se envían con una ventana acotada para no leer la entrada
+    entera en memoria, y los resultados se escriben en el orden de entrada.
+    Con checkpoint se guarda cada checkpoint_every bloques cuántas partidas
+    y cuántos bytes de salida están completos; al relanzar con el mismo
+    archivo se trunca la salida a ese punto y se continúa desde ahí.
+    """
+    workers = workers or os.cpu_count() or 1
+    totals = {'P1': 0, 'P2': 0, None: 0}
+    next_index = 0
+    mode = 'wb'
+
+    state = load_checkpoint(checkpoint) if checkpoint else None
+    if state is not None:
+        if state['config'] != config:
+            raise ValueError(f"El punto de control {checkpoint} es de otra ejecución: {state['config']}")
+        next_index = state['next_index']
+        totals = {'P1': state['totals']['P1'], 'P2': state['totals']['P2'], None: state['totals']['draw']}
+        if state.get('complete'):
+            return totals
+        with open(output, 'r+b') as out:
+            out.truncate(state['output_size'])
+        mode = 'ab'
+
+    board_size, max_moves, seed = config['board_size'], config['max_moves'], config['seed']
+    remaining = (item for item in items if item[0] >= next_index)
+    tasks = ((board_size, max_moves, seed, chunk) for chunk in _chunks(remaining, chunk_size))
+
+    with open(output, mode) as out:
+        consumed = 0
+
+        def save(complete=False):
+            out.flush()
+            os.fsync(out.fileno())
+            save_checkpoint(checkpoint, {
+                'config': config, 'next_index': next_index, 'output_size': out.tell(),
+                'totals': {'P1': totals['P1'], 'P2': totals['P2'], 'draw': totals[None]},
+                'complete': complete,
+            })
+
+        def consume(data, wins, chunk_end):
+            nonlocal consumed, next_index
+            out.write(data)
+            for winner, n in wins.items():
+                totals[winner] += n
+            next_index = chunk_end
+            consumed += 1
+            if checkpoint and consumed % checkpoint_every == 0:
+                save()
+
+        if workers == 1:
+            for task in tasks:
+                consume(*_evaluate_chunk(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for task in tasks:
+                    pending.append(pool.submit(_evaluate_chunk, task))
+                    if len(pending) >= workers * 4:
+                        consume(*pending.popleft().result())
+                while pending:
+                    consume(*pending.popleft().result())
+
+        if checkpoint:
+            save(complete=True)
+
+    return totals
+
+
+def evaluate_file(path, output, workers=None, board_size=4, max_moves=None, seed=0, chunk_size=500,
+                  checkpoint=None):
+    """Evalúa todas las secuencias del archivo con la semántica de manual_play"""
+    config = {'source': os.path.abspath(path), 'board_size': board_size, 'max_moves': max_moves, 'seed': seed}
+    return run_batch(iter_sequences(path), output, config, workers, chunk_size, checkpoint)
+
+
+def simulate_games(n_games, output, workers=None, board_size=4, max_moves=10, seed=0, chunk_size=500,
+                   checkpoint=None):
+    """Juega n_games partidas automáticas con semillas por partida"""
+    config = {'source': f'auto:{n_games}', 'board_size': board_size, 'max_moves': max_moves, 'seed': seed}
+    return run_batch(((index, None) for index in range(n_games)), output, config, workers, chunk_size,
+                     checkpoint)
+
+
+def replay_result(index, seed=0, moves_file=None, board_size=4, max_moves=None):
+    """Reconstruye una partida del lote, con todo su registro, jugando solo esa partida
+
+    La semilla de la partida se deriva de la semilla base y del índice, así
+    que no hace falta repetir el resto del lote.
+    """
+    sequence = None
+    if moves_file is not None:
+        for i, candidate in iter_sequences(moves_file):
+            if i == index:
+                sequence = candidate
+                break
+        else:
+            raise IndexError(f"{moves_file} no tiene la secuencia {index}")
+    game = GameEngine(board_size=board_size)
+    evaluate_sequence(game, sequence, sequence_seed(seed, index), max_moves)
+    return game
+
+
+def main(argv=None):
+    """Evaluación por lotes de un archivo de secuencias o de partidas automáticas"""
+    parser = argparse.ArgumentParser(
+        description="Reproduce en paralelo un archivo de secuencias con la semántica del modo manual")
+    parser.add_argument('moves_file', nargs='?', help="archivo con una cadena de movimientos por línea")
+    parser.add_argument('--auto', type=int, metavar='N', help="juega N partidas automáticas en lugar de leer un archivo")
+    parser.add_argument('--output', default='output/lotes.jsonl', help="archivo JSONL de resultados")
+    parser.add_argument('--workers', type=int, default=None, help="procesos trabajadores (por defecto, uno por CPU)")
+    parser.add_argument('--board-size', type=int, default=4, help="tamaño del tablero NxN")
+    parser.add_argument('--max-moves', type=int, default=None,
+                        help="número máximo de movimientos (por defecto, la longitud de cada secuencia, o 10)")
+    parser.add_argument('--seed', type=int, default=0, help="semilla base; cada partida usa una derivada de su índice")
+    parser.add_argument('--chunk-size', type=int, default=500, help="partidas por bloque de trabajo")
+    parser.add_argument('--checkpoint', help="archivo de punto de control para reanudar una ejecución interrumpida")
+    parser.add_argument('--replay', type=int, metavar='INDEX',
+                        help="reconstruye solo la partida INDEX y genera sus archivos de salida")
+    args = parser.parse_args(argv)
+
+    if args.moves_file is None and args.auto is None:
+        parser.error("indique un archivo de secuencias o --auto N")
+
+    if args.replay is not None:
+        game = replay_result(args.replay, args.seed, args.moves_file, args.board_size, args.max_moves)
+        game.generate_output_files()
+        print(f"Partida {args.replay} (semilla {game.seed}): ganador {game.winner}, "
+              f"{game.current_move_count} movimientos. Archivos en la carpeta 'output'.")
+        return 0
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    start = time.perf_counter()
+    if args.auto is not None:
+        totals = simulate_games(args.auto, args.output, args.workers, args.board_size,
+                                args.max_moves or 10, args.seed, args.chunk_size, args.checkpoint)
+    else:
+        totals = evaluate_file(args.moves_file, args.output, args.workers, args.board_size,
+                               args.max_moves, args.seed, args.chunk_size, args.checkpoint)
+    elapsed = time.perf_counter() - start
+    total = sum(totals.values())
+    print(f"Partidas: {total}  Gana P1: {totals['P1']}  Gana P2: {totals['P2']}  "
+          f"Sin ganador: {totals[None]}  ({total / elapsed:,.0f} partidas/s)")
+    print(f"Resultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+from array import array
+from functools import lru_cache
+
+MOVE_SYMBOLS = ('U', 'D', 'L', 'R', 'UL', 'UR', 'DL', 'DR')
+MOVE_DELTAS = {
+    'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1),
+    'UL': (-1, -1), 'UR': (-1, 1), 'DL': (1, -1), 'DR': (1, 1),
+}
+MOVE_INDEX = {move: i for i, move in enumerate(MOVE_SYMBOLS)}
+NUM_MOVES = len(MOVE_SYMBOLS)
+INVALID = 0
+
+
+def parse_sequence(text):
+    """Convierte 'U,D,L' en una lista de movimientos en mayúsculas"""
+    return [move.strip() for move in text.upper().split(',') if move.strip()]
+
+
+class BoardModel:
+    def __init__(self, board_size):
+        """Precalcula la tabla de transiciones (posición, movimiento) -> destino"""
+        if board_size < 2:
+            raise ValueError("El tablero debe ser de al menos 2x2")
+        self.board_size = board_size
+        self.num_positions = board_size * board_size
+
+        # Las posiciones van de 1 a N*N; la fila 0 queda sin usar y
+        # el destino INVALID (0) marca un movimiento fuera del tablero
+        self.table = array('i', [INVALID]) * ((self.num_positions + 1) * NUM_MOVES)
+        self.neighbors = [()]
+        # Igual que neighbors pero con el índice del movimiento en MOVE_SYMBOLS
+        self.moves_from = [()]
+        for pos in range(1, self.num_positions + 1):
+            row, col = self.position_to_coords(pos)
+            valid = []
+            indexed = []
+            for i, move in enumerate(MOVE_SYMBOLS):
+                d_row, d_col = MOVE_DELTAS[move]
+                new_row, new_col = row + d_row, col + d_col
+                if 0 <= new_row < board_size and 0 <= new_col < board_size:
+                    new_pos = self.coords_to_position(new_row, new_col)
+                    self.table[pos * NUM_MOVES + i] = new_pos
+                    valid.append((move, new_pos))
+                    indexed.append((i, new_pos))
+            self.neighbors.append(tuple(valid))
+            self.moves_from.append(tuple(indexed))
+
+    def position_to_coords(self, position):
+        """Convierte número de posición a coordenadas del tablero (fila, columna)"""
+        return (position - 1) // self.board_size, (position - 1) % self.board_size
+
+    def coords_to_position(self, row, col):
+        """Convierte coordenadas del tablero a número de posición"""
+        return row * self.board_size + col + 1
+
+    def destination(self, position, move):
+        """Devuelve el destino de un movimiento o INVALID si sale del tablero"""
+        index = MOVE_INDEX.get(move)
+        if index is None:
+            return INVALID
+        return self.table[position * NUM_MOVES + index]
+
+
+@lru_cache(maxsize=None)
+def get_board_model(board_size):
+    """Devuelve el modelo de tablero compartido para un tamaño dado"""
+    return BoardModel(board_size)
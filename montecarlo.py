@@ -0,0 +1,91 @@
+import numpy as np
+
+from modelo import NUM_MOVES, get_board_model
+
+
+def _clamp_max_moves(max_moves):
+    """Aplica los mismos límites de movimientos que initialize_game"""
+    return min(max(max_moves, 3), 100)
+
+
+def _simulate_chunk(table, starts, ends, n_games, max_moves, rng):
+    """Simula un bloque de partidas aleatorias en paralelo y devuelve ganador y duración"""
+    winner = np.full(n_games, -1, dtype=np.int8)
+    length = np.zeros(n_games, dtype=np.int16)
+
+    # Solo se guardan las partidas activas; ids apunta a su índice original
+    ids = np.arange(n_games)
+    pos = np.tile(np.asarray(starts, dtype=table.dtype), (n_games, 1))
+    turn = rng.integers(0, 2, size=n_games, dtype=np.int8)
+    count = np.zeros(n_games, dtype=np.int16)
+    rows = np.arange(n_games)
+
+    while ids.size:
+        cur = pos[rows, turn]
+        other = pos[rows, 1 - turn]
+        dest = table[cur]
+        valid = (dest != 0) & (dest != other[:, None])
+        n_valid = valid.sum(axis=1)
+
+        # Elegir uniformemente el k-ésimo movimiento válido de cada partida
+        k = (rng.random(ids.size) * n_valid).astype(np.int8)
+        choice = (valid.cumsum(axis=1) > k[:, None]).argmax(axis=1)
+        moved = n_valid > 0
+        new_pos = np.where(moved, dest[rows, choice], cur)
+        pos[rows, turn] = new_pos
+
+        won = moved & (new_pos == ends[turn])
+        count += ~won
+        done = won | (count >= max_moves)
+
+        finished = ids[done]
+        winner[finished] = np.where(won[done], turn[done], -1)
+        length[finished] = count[done] + won[done]
+
+        keep = ~done
+        ids, pos, turn, count = ids[keep], pos[keep], 1 - turn[keep], count[keep]
+        rows = rows[:ids.size]
+
+    return winner, length
+
+
+def simulate_random_games(n_games, max_moves=10, board_size=4, seed=None, chunk_size=1 << 18):
+    """Simula n partidas con la política aleatoria de auto_play y devuelve estadísticas agregadas"""
+    max_moves = _clamp_max_moves(max_moves)
+    board = get_board_model(board_size)
+    table = np.frombuffer(board.table, dtype=np.intc).reshape(-1, NUM_MOVES)
+    last = board.num_positions
+    starts = (1, board_size)
+    ends = np.array([last, last - board_size + 1], dtype=table.dtype)
+    rng = np.random.default_rng(seed)
+
+    wins = np.zeros(2, dtype=np.int64)
+    draws = 0
+    length_histogram = np.zeros(max_moves + 1, dtype=np.int64)
+    win_length_histogram = np.zeros((2, max_moves + 1), dtype=np.int64)
+
+    remaining = n_games
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        winner, length = _simulate_chunk(table, starts, ends, size, max_moves, rng)
+        for player in (0, 1):
+            mask = winner == player
+            wins[player] += mask.sum()
+            win_length_histogram[player] += np.bincount(length[mask], minlength=max_moves + 1)
+        draws += int((winner == -1).sum())
+        length_histogram += np.bincount(length, minlength=max_moves + 1)
+        remaining -= size
+
+    lengths = np.arange(max_moves + 1)
+    return {
+        'games': n_games,
+        'board_size': board_size,
+        'max_moves': max_moves,
+        'wins': {'P1': int(wins[0]), 'P2': int(wins[1])},
+        'draws': draws,
+        'win_rate': {'P1': float(wins[0]) / n_games, 'P2': float(wins[1]) / n_games},
+        'draw_rate': draws / n_games,
+        'mean_length': float((length_histogram * lengths).sum() / n_games),
+        'length_histogram': length_histogram,
+        'win_length_histogram': {'P1': win_length_histogram[0], 'P2': win_length_histogram[1]},
+    }
@@ -0,0 +1,416 @@
+import os
+import random
+
+from instrumentacion import NULL_PROFILER
+from modelo import INVALID, MOVE_INDEX, MOVE_SYMBOLS, NUM_MOVES, get_board_model
+
+
+class GameObserver:
+    """Interfaz de observador: recibe los eventos del motor sin afectar las reglas"""
+
+    def on_game_start(self, game):
+        """Se invoca cuando comienza una partida"""
+
+    def on_turn_end(self, game):
+        """Se invoca después de cada movimiento o turno pasado"""
+
+    def on_game_over(self, game):
+        """Se invoca una vez cuando la partida termina"""
+
+
+def default_players(board_size, count=2):
+    """Jugadores (nombre, inicio, fin) repartidos por las filas superior e inferior
+
+    Con dos jugadores son los originales: P1 de 1 a N*N y P2 de N a N*N-N+1.
+    Los siguientes salen de la fila superior hacia la casilla espejo de la
+    inferior y, cuando esta se llena, de la inferior hacia la superior.
+    """
+    if not 1 <= count <= 2 * board_size:
+        raise ValueError(f"Un tablero {board_size}x{board_size} admite de 1 a {2 * board_size} jugadores")
+    columns = []
+    left, right = 0, board_size - 1
+    while left <= right:
+        columns.append(left)
+        if right != left:
+            columns.append(right)
+        left, right = left + 1, right - 1
+
+    bottom_row = (board_size - 1) * board_size
+    players = []
+    for i in range(count):
+        col = columns[i % board_size]
+        top, bottom = col + 1, bottom_row + board_size - col
+        if i < board_size:
+            start, end = top, bottom
+        else:
+            start, end = bottom_row + col + 1, board_size - col
+        players.append((f'P{i + 1}', start, end))
+    return players
+
+
+def sequence_seed(base_seed, index):
+    """Semilla determinista de la partida index, independiente del reparto entre procesos"""
+    return base_seed * 1000003 + index
+
+
+class GameEngine:
+    def __init__(self, board_size=4, verbose=False, players=None):
+        """Inicializa el motor del juego sin ninguna dependencia gráfica
+
+        players es una lista de (nombre, inicio, fin) en orden de turno;
+        por defecto los dos jugadores originales P1 y P2.
+        """
+        self.board_size = board_size
+        self.board = get_board_model(board_size)
+        if players is None:
+            players = default_players(board_size)
+        starts = [start for _, start, _ in players]
+        if len(set(starts)) != len(starts):
+            raise ValueError("Cada jugador debe empezar en una casilla distinta")
+        self.player_specs = [tuple(spec) for spec in players]
+        self.players = [name for name, _, _ in players]
+        # Orden de turnos circular: jugador -> siguiente jugador
+        self.next_player = {name: self.players[(i + 1) % len(self.players)]
+                            for i, name in enumerate(self.players)}
+        self.positions = {name: {'current': start, 'start': start, 'end': end}
+                          for name, start, end in players}
+        # Bitset de ocupación: el bit p está activo si hay una pieza en la casilla p
+        self.occupancy = 0
+        for start in starts:
+            self.occupancy |= 1 << start
+        self.turn = None
+        self.first_turn = None
+        # Orden global de turnos: (jugador, movimiento) o (jugador, None) si pasó
+        self.turn_log = []
+        self.moves_history = {name: [] for name in self.players}
+        self.all_possible_moves = {name: set() for name in self.players}
+        self.winning_moves = {name: set() for name in self.players}
+        self.move_symbols = list(MOVE_SYMBOLS)
+        self.max_moves = 0
+        self.current_move_count = 0
+        self.game_over = False
+        self.winner = None
+        self.mode = None
+        # Generador propio de la partida; seed permite reproducirla exactamente
+        self.seed = None
+        self.rng = random.Random()
+        self.move_sequence = {name: [] for name in self.players}
+        self.sequence_index = {name: 0 for name in self.players}
+        # Movimientos inválidos de la secuencia manual: (jugador, pedido, jugado)
+        self.reconfigured_moves = []
+        self.verbose = verbose
+        self.observers = []
+        # Jugadores controlados por una IA con método choose_move(game, player)
+        self.ai_players = {}
+        # Instrumentación opcional; el perfilador nulo no añade costo apreciable
+        self.profiler = NULL_PROFILER
+
+    def log(self, message):
+        """Imprime un mensaje solo si el motor está en modo detallado"""
+        if self.verbose:
+            print(message)
+
+    def add_observer(self, observer):
+        """Registra un observador que recibirá los eventos de la partida"""
+        self.observers.append(observer)
+
+    def set_ai_player(self, player, ai):
+        """Asigna una IA al jugador; None lo devuelve a la política del modo"""
+        if ai is None:
+            self.ai_players.pop(player, None)
+        else:
+            self.ai_players[player] = ai
+
+    def set_position(self, player, position):
+        """Coloca la pieza de un jugador en una casilla manteniendo el bitset de ocupación"""
+        self.occupancy &= ~(1 << self.positions[player]['current'])
+        self.occupancy |= 1 << position
+        self.positions[player]['current'] = position
+
+    def reset(self):
+        """Devuelve las piezas a su inicio y limpia el historial de la partida"""
+        self.occupancy = 0
+        for player in self.positions:
+            self.positions[player]['current'] = self.positions[player]['start']
+            self.occupancy |= 1 << self.positions[player]['start']
+            self.moves_history[player] = []
+            self.all_possible_moves[player] = set()
+            self.winning_moves[player] = set()
+            self.sequence_index[player] = 0
+        self.turn_log = []
+        self.reconfigured_moves = []
+        self.current_move_count = 0
+        self.game_over = False
+        self.winner = None
+
+    def initialize_game(self, mode='auto', max_moves=10, move_sequence=None, seed=None):
+        """Inicializa el juego con los parámetros dados
+
+        Sin seed se toma una del generador global, así que random.seed sigue
+        fijando toda una serie de partidas; la semilla usada queda en self.seed.
+        """
+        self.reset()
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng.seed(self.seed)
+        self.mode = mode
+        self.max_moves = max(max_moves, 3)
+        self.max_moves = min(self.max_moves, 100)
+
+        self.turn = self.players[self.rng.randint(0, len(self.players) - 1)]
+        self.first_turn = self.turn
+        self.log(f"El jugador {self.turn} comienza primero.")
+
+        count = len(self.players)
+        if mode == 'manual' and move_sequence:
+            # La cadena se reparte en partes consecutivas, una por jugador
+            seq_len = len(move_sequence)
+            for i, player in enumerate(self.players):
+                self.move_sequence[player] = list(move_sequence[i * seq_len // count:(i + 1) * seq_len // count])
+        elif mode == 'manual':
+            for player in self.players:
+                self.move_sequence[player] = [self.rng.choice(self.move_symbols) for _ in range(self.max_moves // count)]
+
+    def replay(self, turn_log, first_turn, max_moves, mode=None, seed=None):
+        """Reconstruye una partida grabada turno a turno, sin política ni aleatoriedad
+
+        make_move vuelve a generar moves_history, all_possible_moves y
+        winning_moves; no se notifica a los observadores.
+        """
+        self.reset()
+        self.mode = mode
+        self.seed = seed
+        self.max_moves = max_moves
+        self.turn = self.first_turn = first_turn
+        for player, move in turn_log:
+            self.play_turn(player, move)
+        return self
+
+    def position_to_coords(self, position):
+        """Convierte número de posición (1-N*N) a coordenadas del tablero (fila, columna)"""
+        row = (position - 1) // self.board_size
+        col = (position - 1) % self.board_size
+        return row, col
+
+    def coords_to_position(self, row, col):
+        """Convierte coordenadas del tablero a número de posición"""
+        return row * self.board_size + col + 1
+
+    def is_valid_move(self, player, move):
+        """Verifica si un movimiento es válido para la posición actual del jugador"""
+        index = MOVE_INDEX.get(move)
+        if index is None:
+            return False
+
+        new_pos = self.board.table[self.positions[player]['current'] * NUM_MOVES + index]
+        return new_pos != INVALID and not self.occupancy >> new_pos & 1
+
+    def get_possible_moves(self, player):
+        """Obtiene todos los movimientos válidos para un jugador"""
+        # Solo se prueban los bits de los (a lo sumo 8) vecinos de la casilla actual
+        occupancy = self.occupancy
+        return [move for move, new_pos in self.board.neighbors[self.positions[player]['current']]
+                if not occupancy >> new_pos & 1]
+
+    def make_move(self, player, move):
+        """Ejecuta un movimiento para un jugador"""
+        if self.game_over:
+            return False
+
+        current_pos = self.positions[player]['current']
+        new_pos = self.board.destination(current_pos, move)
+        # Igual que un movimiento fuera del tablero, una casilla ocupada se rechaza
+        if new_pos == INVALID or self.occupancy >> new_pos & 1:
+            return False
+
+        self.positions[player]['current'] = new_pos
+        self.occupancy &= ~(1 << current_pos)
+        self.occupancy |= 1 << new_pos
+        self.moves_history[player].append((current_pos, new_pos, move))
+        self.turn_log.append((player, move))
+
+        for possible_move in self.get_possible_moves(player):
+            self.all_possible_moves[player].add((current_pos, possible_move))
+            if new_pos == self.positions[player]['end']:
+                self.winning_moves[player].add((current_pos, possible_move))
+
+        if new_pos == self.positions[player]['end']:
+            self.game_over = True
+            self.winner = player
+            self.log(f"¡El jugador {player} ha ganado!")
+            return True
+
+        self.current_move_count += 1
+        if self.current_move_count >= self.max_moves:
+            self.game_over = True
+            self.log("Juego terminado sin ganador (límite de movimientos alcanzado).")
+            return False
+
+        self.turn = self.next_player[player]
+        return True
+
+    def pass_turn(self, player):
+        """Cede el turno al otro jugador consumiendo un movimiento"""
+        self.turn_log.append((player, None))
+        self.turn = self.next_player[player]
+        self.current_move_count += 1
+
+    def play_turn(self, player, move):
+        """Reproduce una entrada de turn_log: un movimiento o un turno pasado"""
+        if move is None:
+            self.pass_turn(player)
+        else:
+            self.make_move(player, move)
+
+    def is_valid_move_from_position(self, player, from_pos, move):
+        """Verifica si un movimiento es válido desde una posición dada"""
+        return self.board.destination(from_pos, move) != INVALID
+
+    def calculate_new_position(self, from_pos, move):
+        """Calcula la nueva posición desde una posición y movimiento dados"""
+        new_pos = self.board.destination(from_pos, move)
+        return new_pos if new_pos != INVALID else None
+
+    def _notify(self, event):
+        """Envía un evento a todos los observadores registrados"""
+        for observer in self.observers:
+            getattr(observer, event)(self)
+
+    def next_turn(self, player):
+        """Decide la jugada del jugador en turno según el modo; None significa pasar el turno"""
+        ai = self.ai_players.get(player)
+        if ai is not None:
+            return self._next_ai_move(player, ai)
+        if self.mode == 'manual':
+            return self._next_manual_move(player)
+        return self._next_auto_move(player)
+
+    def _next_auto_move(self, player):
+        """Elige al azar entre los movimientos válidos"""
+        possible_moves = self.get_possible_moves(player)
+        if not possible_moves:
+            self.log(f"El jugador {player} no tiene movimientos válidos. Pasando turno.")
+            return None
+
+        move = self.rng.choice(possible_moves)
+        self.log(f"Jugador {player} mueve desde {self.positions[player]['current']} con {move}")
+        return move
+
+    def _next_ai_move(self, player, ai):
+        """Pide la jugada a la IA asignada al jugador"""
+        move = ai.choose_move(self, player)
+        if move is None:
+            self.log(f"El jugador {player} no tiene movimientos válidos. Pasando turno.")
+        else:
+            self.log(f"Jugador {player} (IA) mueve desde {self.positions[player]['current']} con {move}")
+        return move
+
+    def _next_manual_move(self, player):
+        """Toma el siguiente movimiento de la secuencia, reconfigurándolo si es inválido"""
+        move_sequence = self.move_sequence[player]
+        current_idx = self.sequence_index[player]
+
+        if current_idx >= len(move_sequence):
+            self.log(f"Secuencia de movimientos agotada para {player}. Pasando turno.")
+            return None
+
+        move = move_sequence[current_idx]
+        self.sequence_index[player] += 1
+
+        if self.is_valid_move(player, move):
+            self.log(f"Jugador {player} mueve desde {self.positions[player]['current']} con {move}")
+            return move
+
+        self.log(f"Movimiento {move} no válido para {player} en posición {self.positions[player]['current']}. Intentando reconfigurar...")
+        possible_moves = self.get_possible_moves(player)
+        if possible_moves:
+            move = self.rng.choice(possible_moves)
+            self.reconfigured_moves.append((player, move_sequence[current_idx], move))
+            self.profiler.count('reconfigured')
+            self.log(f"Reconfigurado: {player} mueve con {move} en lugar")
+            return move
+
+        self.log(f"No hay movimientos válidos para {player}. Pasando turno.")
+        return None
+
+    def run_loop(self):
+        """Bucle de juego síncrono: decide, aplica y notifica cada turno"""
+        self._notify('on_game_start')
+
+        if self.profiler.enabled:
+            self._run_instrumented_loop()
+        else:
+            while not self.game_over and self.current_move_count < self.max_moves:
+                player = self.turn
+                self.play_turn(player, self.next_turn(player))
+                self._notify('on_turn_end')
+
+        self._notify('on_game_over')
+
+    def _run_instrumented_loop(self):
+        """Mismo bucle que run_loop, midiendo cada fase del turno"""
+        profiler = self.profiler
+        while not self.game_over and self.current_move_count < self.max_moves:
+            player = self.turn
+            with profiler.phase('move_selection'):
+                move = self.next_turn(player)
+            profiler.count('passes' if move is None else 'moves')
+            with profiler.phase('make_move'):
+                self.play_turn(player, move)
+            with profiler.phase('observers'):
+                self._notify('on_turn_end')
+
+    def auto_play(self):
+        """Juega automáticamente eligiendo movimientos válidos al azar"""
+        if self.mode != 'auto':
+            self.log("El modo no es automático.")
+            return
+
+        self.log("Iniciando juego en modo automático...")
+        self.run_loop()
+        self.profiler.end_game()
+
+    def manual_play(self):
+        """Juega con las secuencias predefinidas, reconfigurando los movimientos inválidos"""
+        if self.mode != 'manual':
+            self.log("El modo no es manual.")
+            return
+
+        self.log("Iniciando juego en modo manual...")
+        for player in self.players:
+            self.log(f"Secuencia {player}: {self.move_sequence[player]}")
+        self.run_loop()
+        self.profiler.end_game()
+
+    def generate_output_files(self):
+        """Genera archivos de salida con todos los movimientos y movimientos ganadores"""
+        with self.profiler.phase('output_files'):
+            if not os.path.exists('output'):
+                os.makedirs('output')
+
+            with open('output/all_possible_moves.txt', 'w') as f:
+                f.write("Todos los movimientos posibles:\n")
+                for player in self.players:
+                    f.write(f"\nJugador {player}:\n")
+                    for from_pos, move in sorted(self.all_possible_moves[player]):
+                        to_pos = self.calculate_new_position(from_pos, move)
+                        f.write(f"Desde {from_pos} con {move} -> {to_pos}\n")
+
+            with open('output/winning_moves.txt', 'w') as f:
+                f.write("Movimientos ganadores:\n")
+                for player in self.players:
+                    f.write(f"\nJugador {player}:\n")
+                    if self.winning_moves[player]:
+                        for from_pos, move in sorted(self.winning_moves[player]):
+                            to_pos = self.calculate_new_position(from_pos, move)
+                            f.write(f"Desde {from_pos} con {move} -> {to_pos} (GANA)\n")
+                    else:
+                        f.write("No se encontraron movimientos ganadores.\n")
+
+            with open('output/move_history.txt', 'w') as f:
+                f.write("Historial de movimientos:\n")
+                for player in self.players:
+                    f.write(f"\nJugador {player}:\n")
+                    for i, (from_pos, to_pos, move) in enumerate(self.moves_history[player], 1):
+                        f.write(f"Movimiento {i}: Desde {from_pos} con {move} -> {to_pos}\n")
+
+            self.log("Archivos de salida generados en la carpeta 'output'.")
@@ -0,0 +1,112 @@
+import asyncio
+
+
+class MoveScheduler:
+    def __init__(self, game, tick=1.0, ticks_per_move=10, on_tick=None, on_idle=None,
+                 poll_interval=0.05):
+        """Planificador de turnos no bloqueante para un motor de juego
+
+        tick es la duración en segundos de cada paso de la cuenta regresiva
+        (0 avanza sin esperas). on_tick recibe los segundos restantes y
+        on_idle se llama periódicamente mientras se espera, por ejemplo para
+        procesar los eventos de la ventana.
+        """
+        self.game = game
+        self.tick = tick
+        self.ticks_per_move = ticks_per_move
+        self.on_tick = on_tick
+        self.on_idle = on_idle
+        self.poll_interval = poll_interval
+        self._running = None
+
+    def set_tick(self, tick):
+        """Cambia la duración del paso; 0 activa el avance rápido"""
+        self.tick = tick
+
+    @property
+    def paused(self):
+        """Indica si la partida está en pausa"""
+        return self._running is not None and not self._running.is_set()
+
+    def pause(self):
+        """Detiene el avance de la partida hasta llamar a resume"""
+        if self._running is not None:
+            self._running.clear()
+
+    def resume(self):
+        """Reanuda la partida pausada"""
+        if self._running is not None:
+            self._running.set()
+
+    def toggle_pause(self):
+        """Alterna entre pausa y reanudación"""
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    async def _sleep(self, seconds):
+        """Espera sin bloquear, atendiendo on_idle y respetando la pausa"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        while True:
+            if self.on_idle is not None:
+                self.on_idle()
+            if self.paused:
+                # El tiempo en pausa no cuenta para la cuenta regresiva
+                remaining = deadline - loop.time()
+                await self._wait_resumed()
+                deadline = loop.time() + remaining
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+    async def _wait_resumed(self):
+        """Espera a que se reanude, procesando eventos mientras tanto"""
+        while self.paused:
+            if self.on_idle is not None:
+                self.on_idle()
+            await asyncio.sleep(self.poll_interval)
+
+    async def countdown(self):
+        """Cuenta regresiva entre movimientos; no hace nada con tick igual a 0"""
+        if self.tick <= 0:
+            await asyncio.sleep(0)
+            return
+
+        for seconds_left in range(self.ticks_per_move, 0, -1):
+            if self.on_tick is not None:
+                self.on_tick(seconds_left)
+            await self._sleep(self.tick)
+            if self.tick <= 0:
+                break
+        if self.on_tick is not None:
+            self.on_tick(0)
+
+    def _select_move(self, player):
+        """Decide la jugada en segundo plano midiendo su costo"""
+        with self.game.profiler.phase('move_selection'):
+            return self.game.next_turn(player)
+
+    async def run(self):
+        """Juega la partida; la siguiente jugada se calcula mientras corre la cuenta regresiva"""
+        game = self.game
+        loop = asyncio.get_running_loop()
+        self._running = asyncio.Event()
+        self._running.set()
+
+        game._notify('on_game_start')
+        while not game.game_over and game.current_move_count < game.max_moves:
+            player = game.turn
+            decision = loop.run_in_executor(None, self._select_move, player)
+            with game.profiler.phase('wait'):
+                await self.countdown()
+                move = await decision
+                await self._wait_resumed()
+            game.profiler.count('passes' if move is None else 'moves')
+            with game.profiler.phase('make_move'):
+                game.play_turn(player, move)
+            with game.profiler.phase('observers'):
+                game._notify('on_turn_end')
+        game._notify('on_game_over')
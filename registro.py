@@ -0,0 +1,138 @@
+import json
+
+from instrumentacion import NULL_PROFILER
+from modelo import MOVE_INDEX, NUM_MOVES
+from motor import GameEngine, GameObserver
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_line(record):
+    """Serializa un registro como una línea JSON en bytes"""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n').encode()
+
+
+def loads_line(line):
+    """Deserializa una línea JSON"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def game_record(game, game_id, seed=None):
+    """Construye el registro estructurado de una partida terminada; por defecto con la semilla de la partida"""
+    table = game.board.table
+
+    # Destino None si sale del tablero, como en generate_output_files
+    def with_destination(edges):
+        return [[from_pos, move, table[from_pos * NUM_MOVES + MOVE_INDEX[move]] or None]
+                for from_pos, move in sorted(edges)]
+
+    return {
+        'game_id': game_id,
+        'seed': game.seed if seed is None else seed,
+        'board_size': game.board_size,
+        'players': game.player_specs,
+        'max_moves': game.max_moves,
+        'mode': game.mode,
+        'first_turn': game.first_turn,
+        'history': game.turn_log,
+        'possible_moves': {player: with_destination(edges)
+                           for player, edges in game.all_possible_moves.items()},
+        'winning_moves': {player: with_destination(edges)
+                          for player, edges in game.winning_moves.items()},
+        'winner': game.winner,
+        'moves': game.current_move_count,
+    }
+
+
+class GameRecordWriter(GameObserver):
+    def __init__(self, path, buffer_size=1000, start_id=0, profiler=NULL_PROFILER):
+        """Escritor de registros JSONL que solo añade al final y escribe por bloques"""
+        self.path = path
+        self.profiler = profiler
+        self.buffer_size = buffer_size
+        self.next_id = start_id
+        self.buffer = []
+        self.file = open(path, 'ab')
+
+    def write(self, game, game_id=None, seed=None):
+        """Añade el registro de una partida al búfer y lo vuelca si está lleno"""
+        if game_id is None:
+            game_id = self.next_id
+        self.next_id = game_id + 1
+        self.buffer.append(dumps_line(game_record(game, game_id, seed)))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+        return game_id
+
+    def flush(self):
+        """Escribe todo el búfer en una sola operación"""
+        with self.profiler.phase('record_write'):
+            if self.buffer:
+                self.file.write(b''.join(self.buffer))
+                self.buffer = []
+            self.file.flush()
+
+    def close(self):
+        """Vuelca lo pendiente y cierra el archivo"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def on_game_over(self, game):
+        """Como observador, registra cada partida en cuanto termina"""
+        self.write(game)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_records(path):
+    """Recorre los registros de un archivo JSONL uno a uno"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads_line(line)
+
+
+def find_record(path, game_id):
+    """Busca el registro de una partida por su game_id"""
+    for record in read_records(path):
+        if record['game_id'] == game_id:
+            return record
+    raise KeyError(f"No hay ninguna partida con game_id {game_id} en {path}")
+
+
+def replay_record(record, game=None):
+    """Reconstruye una partida grabada, incluidos all_possible_moves y winning_moves
+
+    Se reproduce el historial de turnos directamente, sin volver a
+    ejecutar la política ni el resto del lote.
+    """
+    if game is None:
+        players = record.get('players')
+        game = GameEngine(board_size=record['board_size'],
+                          players=[tuple(spec) for spec in players] if players else None)
+    history = [(player, move) for player, move in record['history']]
+    return game.replay(history, record['first_turn'], record['max_moves'],
+                       mode=record.get('mode'), seed=record.get('seed'))
+
+
+def load_summary(path):
+    """Carga las columnas de resumen de todas las partidas para su análisis"""
+    columns = {'game_id': [], 'seed': [], 'board_size': [], 'max_moves': [],
+               'first_turn': [], 'winner': [], 'moves': [], 'turns': []}
+    for record in read_records(path):
+        for key in ('game_id', 'seed', 'board_size', 'max_moves', 'first_turn', 'winner', 'moves'):
+            columns[key].append(record[key])
+        columns['turns'].append(len(record['history']))
+    return columns
@@ -0,0 +1,251 @@
+import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import to_rgba
+from matplotlib.gridspec import GridSpec
+from matplotlib.patches import FancyArrow, FancyArrowPatch, Rectangle
+
+from motor import GameObserver
+
+PLAYER_COLORS = {'P1': 'red', 'P2': 'blue'}
+# Colores de los nodos de inicio y fin en el NFA para los jugadores originales
+NODE_COLORS = {'P1': ('pink', 'lightcoral'), 'P2': ('lightblue', 'deepskyblue')}
+# Colores de los jugadores adicionales en partidas de más de dos
+EXTRA_COLORS = ('green', 'orange', 'purple', 'brown', 'olive', 'cyan', 'magenta', 'black')
+
+
+def player_color(game, player):
+    """Color de un jugador: los originales conservan rojo y azul"""
+    if player in PLAYER_COLORS:
+        return PLAYER_COLORS[player]
+    return EXTRA_COLORS[game.players.index(player) % len(EXTRA_COLORS)]
+
+
+def special_node_colors(game):
+    """Color de los nodos de inicio y fin de cada jugador; si coinciden, gana el primero"""
+    special = {}
+    for player in game.players:
+        if player in NODE_COLORS:
+            start, end = NODE_COLORS[player]
+        else:
+            color = player_color(game, player)
+            start, end = to_rgba(color, 0.3), to_rgba(color, 0.6)
+        special.setdefault(game.positions[player]['start'], start)
+        special.setdefault(game.positions[player]['end'], end)
+    return special
+
+
+class IncrementalRenderer(GameObserver):
+    def __init__(self, game, fig=None):
+        """Crea la figura y dibuja una sola vez todo lo que no cambia durante la partida"""
+        self.game = game
+        self.fig = fig if fig is not None else plt.figure(figsize=(14, 7))
+        gs = GridSpec(1, 2, width_ratios=[1, 1.5], figure=self.fig)
+        self.ax_board = self.fig.add_subplot(gs[0])
+        self.ax_nfa = self.fig.add_subplot(gs[1])
+
+        self.background = None
+        # Solo se muestra una ventana si la figura se creó con pyplot
+        self.shown = fig is not None
+        self.result = None
+        # Artistas permanentes (flechas y aristas) aún no incluidos en el fondo
+        self.pending = []
+        self.history_artists = []
+        self.drawn_moves = {player: 0 for player in game.positions}
+        self.drawn_edges = set()
+
+        self._draw_static_board()
+        self._draw_static_nfa()
+        self._create_dynamic_artists()
+        self.fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def board_coords(self, position):
+        """Centro de una casilla en coordenadas del eje (columna, fila invertida)"""
+        row, col = self.game.position_to_coords(position)
+        return col + 0.5, self.game.board_size - 0.5 - row
+
+    def node_coords(self, position):
+        """Ubicación de un nodo del NFA, igual que el layout de draw_full_nfa"""
+        row, col = self.game.position_to_coords(position)
+        return col, self.game.board_size - 1 - row
+
+    def _draw_static_board(self):
+        """Dibuja las casillas y las etiquetas de inicio y fin"""
+        ax = self.ax_board
+        size = self.game.board_size
+        ax.set_xlim(0, size)
+        ax.set_ylim(0, size)
+        ax.set_xticks(range(size + 1))
+        ax.set_yticks(range(size + 1))
+        ax.grid(True)
+
+        rectangles = []
+        for i in range(size):
+            for j in range(size):
+                color = 'white' if (i + j) % 2 == 0 else 'gray'
+                rectangles.append(Rectangle((j, size - 1 - i), 1, 1, color=color))
+        ax.add_collection(PatchCollection(rectangles, match_original=True))
+
+        for player, info in self.game.positions.items():
+            start_x, start_y = self.board_coords(info['start'])
+            end_x, end_y = self.board_coords(info['end'])
+            ax.text(start_x, start_y - 0.2, f"Inicio {player}", ha='center', va='center', fontsize=8)
+            ax.text(end_x, end_y + 0.2, f"Fin {player}", ha='center', va='center', fontsize=8)
+
+    def _draw_static_nfa(self):
+        """Dibuja los nodos del NFA con sus colores de inicio y fin"""
+        ax = self.ax_nfa
+        special = special_node_colors(self.game)
+        nodes = range(1, self.game.board.num_positions + 1)
+        coords = [self.node_coords(node) for node in nodes]
+        ax.scatter([x for x, _ in coords], [y for _, y in coords], s=800, zorder=2,
+                   c=[special.get(node, 'lightgray') for node in nodes])
+        for node, (x, y) in zip(nodes, coords):
+            ax.text(x, y, str(node), ha='center', va='center', fontweight='bold', zorder=3)
+
+        margin = 0.5
+        ax.set_xlim(-margin, self.game.board_size - 1 + margin)
+        ax.set_ylim(-margin, self.game.board_size - 1 + margin)
+        ax.set_axis_off()
+        ax.set_title("Red NFA de Movimientos")
+
+    def _create_dynamic_artists(self):
+        """Crea los artistas que cambian en cada movimiento; se redibujan con blitting"""
+        self.markers = {}
+        self.labels = {}
+        for player in self.game.players:
+            color = player_color(self.game, player)
+            x, y = self.board_coords(self.game.positions[player]['current'])
+            self.markers[player], = self.ax_board.plot(
+                x, y, 'o', markersize=20, color=color, alpha=0.5,
+                label=f'Jugador {player}', animated=True)
+            self.labels[player] = self.ax_board.text(
+                x, y, player, ha='center', va='center', color='white',
+                fontweight='bold', animated=True)
+        self.ax_board.legend(loc='upper right')
+
+        self.title = self.ax_board.set_title("", animated=True)
+        self.turn_text = self.fig.text(0.5, 0.02, "", ha='center', va='bottom',
+                                       fontsize=12, animated=True)
+        self.timer_text = self.fig.text(0.5, 0.95, "", ha='center', va='top',
+                                        fontsize=12, color='red', animated=True)
+        self.dynamic_artists = [*self.markers.values(), *self.labels.values(),
+                                self.title, self.turn_text, self.timer_text]
+
+    def _on_draw(self, event):
+        """Tras un redibujado completo se vuelve a capturar el fondo"""
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.pending = []
+        self._draw_dynamic()
+
+    def _draw_dynamic(self):
+        """Dibuja los artistas animados sobre el fondo actual"""
+        for artist in self.dynamic_artists:
+            self.fig.draw_artist(artist)
+
+    def _add_history_artists(self):
+        """Crea solo las flechas y aristas nuevas desde el último cuadro"""
+        for player, history in self.game.moves_history.items():
+            color = player_color(self.game, player)
+            for from_pos, to_pos, _ in history[self.drawn_moves[player]:]:
+                from_x, from_y = self.board_coords(from_pos)
+                to_x, to_y = self.board_coords(to_pos)
+                arrow = FancyArrow(from_x, from_y, (to_x - from_x) * 0.8, (to_y - from_y) * 0.8,
+                                   head_width=0.1, head_length=0.1, fc=color, ec=color, alpha=0.3)
+                self.ax_board.add_patch(arrow)
+                self.pending.append(arrow)
+                self.history_artists.append(arrow)
+            self.drawn_moves[player] = len(history)
+
+        for player, moves in self.game.all_possible_moves.items():
+            for from_pos, move in moves:
+                to_pos = self.game.calculate_new_position(from_pos, move)
+                if not to_pos or (from_pos, to_pos, player) in self.drawn_edges:
+                    continue
+                self.drawn_edges.add((from_pos, to_pos, player))
+                start, end = self.node_coords(from_pos), self.node_coords(to_pos)
+                edge = FancyArrowPatch(start, end, arrowstyle='-|>', mutation_scale=10,
+                                       color=player_color(self.game, player), shrinkA=14, shrinkB=14, zorder=1)
+                label = self.ax_nfa.text((start[0] + end[0]) / 2, (start[1] + end[1]) / 2, move,
+                                         color='green', ha='center', va='center', fontsize=10,
+                                         bbox=dict(boxstyle='round', ec='white', fc='white'))
+                self.ax_nfa.add_patch(edge)
+                self.pending.extend([edge, label])
+                self.history_artists.extend([edge, label])
+
+    def queue_history(self):
+        """Prepara las flechas y aristas nuevas sin dibujar el cuadro; el próximo render las dibuja en orden"""
+        self._add_history_artists()
+
+    def _update_dynamic_artists(self):
+        """Mueve las piezas y actualiza los textos del cuadro"""
+        for player in self.game.players:
+            x, y = self.board_coords(self.game.positions[player]['current'])
+            self.markers[player].set_data([x], [y])
+            self.labels[player].set_position((x, y))
+        self.title.set_text(f"Tablero - Movimiento {self.game.current_move_count}")
+        if self.result is not None:
+            self.turn_text.set_text(self.result)
+        elif self.game.game_over:
+            self.turn_text.set_text("")
+        else:
+            self.turn_text.set_text(f"Turno actual: Jugador {self.game.turn}")
+
+    def reset(self):
+        """Elimina las flechas y aristas de la partida anterior"""
+        for artist in self.history_artists:
+            artist.remove()
+        self.history_artists = []
+        self.pending = []
+        self.drawn_moves = {player: 0 for player in self.game.positions}
+        self.drawn_edges = set()
+        self.result = None
+        self.turn_text.set_color('black')
+        self.timer_text.set_text("")
+        self.background = None
+
+    def render(self):
+        """Dibuja un cuadro: solo los artistas nuevos y los que se mueven"""
+        profiler = self.game.profiler
+        profiler.count('redraws')
+        with profiler.phase('render'):
+            self._add_history_artists()
+            self._update_dynamic_artists()
+            canvas = self.fig.canvas
+
+            if self.background is None:
+                if not self.shown:
+                    plt.show(block=False)
+                    self.shown = True
+                canvas.draw()
+            else:
+                canvas.restore_region(self.background)
+                if self.pending:
+                    for artist in self.pending:
+                        artist.axes.draw_artist(artist)
+                    self.background = canvas.copy_from_bbox(self.fig.bbox)
+                    self.pending = []
+                self._draw_dynamic()
+                canvas.blit(self.fig.bbox)
+            canvas.flush_events()
+
+    def set_timer(self, seconds_left):
+        """Actualiza únicamente el texto del temporizador"""
+        self.timer_text.set_text(f"Tiempo para próximo movimiento: {seconds_left} segundos")
+        self.render()
+
+    def show_result(self, text):
+        """Muestra el resultado final en lugar del texto de turno"""
+        self.result = text
+        self.timer_text.set_text("")
+        self.turn_text.set_color('green')
+        self.render()
+
+    def on_game_start(self, game):
+        """Prepara la figura para una nueva partida"""
+        self.reset()
+        self.render()
+
+    def on_turn_end(self, game):
+        """Dibuja el cuadro correspondiente al último movimiento"""
+        self.render()
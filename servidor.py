@@ -0,0 +1,266 @@
+import argparse
+import asyncio
+import itertools
+import sys
+
+from modelo import MOVE_SYMBOLS
+from motor import GameEngine, default_players
+from registro import dumps_line, loads_line
+
+# Tamaños de tablero que acepta 'new': uno mayor bloquearía el bucle de eventos al crearlo
+MIN_BOARD_SIZE = 2
+MAX_BOARD_SIZE = 64
+
+
+class Session:
+    """Partida alojada en el servidor: un motor sin ventana, sus suscriptores y su temporizador"""
+    __slots__ = ('id', 'game', 'auto_players', 'subscribers', 'timer', 'turn_timeout')
+
+    def __init__(self, session_id, game, auto_players, turn_timeout):
+        self.id = session_id
+        self.game = game
+        self.auto_players = auto_players
+        self.subscribers = set()
+        self.timer = None
+        self.turn_timeout = turn_timeout
+
+    def state(self):
+        """Mensaje de estado que se envía a los clientes"""
+        game = self.game
+        return {
+            'type': 'state',
+            'session': self.id,
+            'turn': game.turn,
+            'positions': {player: info['current'] for player, info in game.positions.items()},
+            'moves': game.get_possible_moves(game.turn) if not self.finished else [],
+            'move_count': game.current_move_count,
+            'max_moves': game.max_moves,
+            'game_over': self.finished,
+            'winner': game.winner,
+            'last': list(game.turn_log[-1]) if game.turn_log else None,
+        }
+
+    @property
+    def finished(self):
+        return self.game.game_over or self.game.current_move_count >= self.game.max_moves
+
+
+class GameServer:
+    def __init__(self, turn_timeout=30.0, max_sessions=100000):
+        """Servidor asyncio de partidas con un protocolo de líneas JSON
+
+        Cada línea es un objeto con 'op' (new, join, move, state, close) y un
+        'id' opcional que se devuelve en la respuesta. Los cambios de estado
+        provocados por otros (jugadores automáticos, tiempos agotados) se
+        envían a los suscriptores de la sesión sin 'id'.
+        """
+        self.turn_timeout = turn_timeout
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self.ids = itertools.count(1)
+        self.server = None
+        self.handlers = {
+            'new': self.op_new,
+            'join': self.op_join,
+            'move': self.op_move,
+            'state': self.op_state,
+            'close': self.op_close,
+        }
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        """Empieza a escuchar por TCP o, si se da path, por un socket Unix"""
+        if path:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def serve_forever(self, host='127.0.0.1', port=8765, path=None):
+        server = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self):
+        """Cancela los temporizadores y deja de aceptar conexiones"""
+        for session in self.sessions.values():
+            if session.timer is not None:
+                session.timer.cancel()
+        self.sessions.clear()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """Atiende una conexión: una petición por línea, una respuesta por petición"""
+        subscribed = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = {}
+                try:
+                    message = loads_line(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("Cada línea debe ser un objeto JSON")
+                    handler = self.handlers.get(message.get('op'))
+                    if handler is None:
+                        raise ValueError(f"Operación desconocida: {message.get('op')}")
+                    response = handler(message, writer, subscribed)
+                except (ValueError, TypeError, KeyError) as error:
+                    response = {'type': 'error', 'message': str(error)}
+                if 'id' in message:
+                    response['id'] = message['id']
+                writer.write(dumps_line(response))
+                # Contrapresión: no se leen más peticiones si el cliente no consume
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # Las sesiones sin ningún suscriptor ya no las juega nadie
+            for session_id in subscribed:
+                session = self.sessions.get(session_id)
+                if session is not None:
+                    session.subscribers.discard(writer)
+                    if not session.subscribers:
+                        self._drop(session)
+            writer.close()
+
+    def _session(self, message):
+        session = self.sessions.get(message.get('session'))
+        if session is None:
+            raise ValueError(f"Sesión inexistente: {message.get('session')}")
+        return session
+
+    def op_new(self, message, writer, subscribed):
+        """Crea una partida; 'auto' lista los jugadores que mueve el servidor"""
+        if len(self.sessions) >= self.max_sessions:
+            raise ValueError("Se alcanzó el número máximo de sesiones")
+        board_size = int(message.get('board_size', 4))
+        if not MIN_BOARD_SIZE <= board_size <= MAX_BOARD_SIZE:
+            raise ValueError(f"El tablero debe ser de {MIN_BOARD_SIZE}x{MIN_BOARD_SIZE} "
+                             f"a {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE}")
+        game = GameEngine(board_size=board_size,
+                          players=default_players(board_size, int(message.get('players', 2))))
+        auto_players = set(message.get('auto', ()))
+        unknown = auto_players - set(game.players)
+        if unknown:
+            raise ValueError(f"Jugadores desconocidos: {', '.join(sorted(unknown))}")
+        game.initialize_game(mode='auto', max_moves=int(message.get('max_moves', 10)))
+
+        session = Session(next(self.ids), game, auto_players,
+                          float(message.get('turn_timeout', self.turn_timeout)))
+        self.sessions[session.id] = session
+        session.subscribers.add(writer)
+        subscribed.add(session.id)
+        self._advance(session, exclude=writer)
+        return session.state()
+
+    def op_join(self, message, writer, subscribed):
+        """Suscribe la conexión a las actualizaciones de una sesión existente"""
+        session = self._session(message)
+        session.subscribers.add(writer)
+        subscribed.add(session.id)
+        return session.state()
+
+    def op_state(self, message, writer, subscribed):
+        return self._session(message).state()
+
+    def op_move(self, message, writer, subscribed):
+        """Aplica un movimiento en notación U/D/L/R/UL/UR/DL/DR validado como is_valid_move"""
+        session = self._session(message)
+        game = session.game
+        player = message.get('player', game.turn)
+        move = str(message.get('move', '')).upper()
+        if session.finished:
+            raise ValueError("La partida ya terminó")
+        if player != game.turn:
+            raise ValueError(f"No es el turno de {player}; juega {game.turn}")
+        if move not in MOVE_SYMBOLS:
+            raise ValueError(f"Movimiento no reconocido: {move}")
+        if not game.is_valid_move(player, move):
+            raise ValueError(f"Movimiento inválido {move} para {player} desde {game.positions[player]['current']}")
+
+        game.make_move(player, move)
+        self._advance(session, exclude=writer)
+        return session.state()
+
+    def op_close(self, message, writer, subscribed):
+        session = self._session(message)
+        self._drop(session)
+        subscribed.discard(session.id)
+        return {'type': 'closed', 'session': session.id}
+
+    def _drop(self, session):
+        """Elimina una sesión y cancela su temporizador"""
+        self.sessions.pop(session.id, None)
+        if session.timer is not None:
+            session.timer.cancel()
+            session.timer = None
+
+    def _advance(self, session, exclude=None):
+        """Juega los turnos automáticos y pasados, reprograma el temporizador y notifica"""
+        game = session.game
+        while not session.finished:
+            player = game.turn
+            if player in session.auto_players:
+                game.play_turn(player, game.next_turn(player))
+            elif not game.get_possible_moves(player):
+                game.pass_turn(player)
+            else:
+                break
+
+        if session.timer is not None:
+            session.timer.cancel()
+            session.timer = None
+        if not session.finished and session.turn_timeout > 0:
+            loop = asyncio.get_running_loop()
+            session.timer = loop.call_later(session.turn_timeout, self._on_timeout, session)
+        self._publish(session, exclude)
+
+    def _on_timeout(self, session):
+        """Tiempo agotado: el servidor juega un movimiento al azar por el jugador en turno"""
+        session.timer = None
+        if session.id not in self.sessions or session.finished:
+            return
+        player = session.game.turn
+        session.game.play_turn(player, session.game.next_turn(player))
+        self._advance(session)
+
+    def _publish(self, session, exclude=None):
+        """Envía el estado a los suscriptores, salvo a quien ya lo recibe como respuesta"""
+        targets = [writer for writer in session.subscribers if writer is not exclude]
+        if not targets:
+            return
+        data = dumps_line(session.state())
+        for writer in targets:
+            if writer.is_closing():
+                session.subscribers.discard(writer)
+            else:
+                writer.write(data)
+        if not session.subscribers:
+            self._drop(session)
+
+
+def main(argv=None):
+    """Inicia el servidor de partidas"""
+    parser = argparse.ArgumentParser(description="Servidor asyncio de partidas con protocolo de líneas JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument('--turn-timeout', type=float, default=30.0,
+                        help="segundos por turno antes de mover al azar (0 = sin límite)")
+    args = parser.parse_args(argv)
+
+    server = GameServer(turn_timeout=args.turn_timeout)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Servidor escuchando en {where}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
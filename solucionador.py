@@ -0,0 +1,141 @@
+import os
+
+import numpy as np
+
+from estado import PLAYERS
+from modelo import MOVE_SYMBOLS, NUM_MOVES, get_board_model
+
+
+class GameSolver:
+    def __init__(self, board_size=4, max_moves=100, cache_dir=os.path.join('output', 'cache')):
+        """Prepara el solucionador exacto para un tamaño de tablero y límite de movimientos"""
+        self.board_size = board_size
+        self.max_moves = min(max(max_moves, 3), 100)
+        self.cache_dir = cache_dir
+        self.board = get_board_model(board_size)
+        last = self.board.num_positions
+        self.ends = (last, last - board_size + 1)
+
+        # Tablas por capa de movimientos restantes, indexadas [capa, turno, P1 - 1, P2 - 1]
+        self.values = None
+        self.p1_wins = None
+        self.p2_wins = None
+        self.winning_masks = None
+
+    def cache_path(self):
+        """Ruta del archivo de caché para esta configuración"""
+        name = f"solucion_{self.board_size}x{self.board_size}_{self.max_moves}.npz"
+        return os.path.join(self.cache_dir, name)
+
+    def solve(self):
+        """Resuelve todos los estados, cargando desde la caché de disco si existe"""
+        if self.values is not None:
+            return self
+
+        if self.cache_dir and os.path.exists(self.cache_path()):
+            with np.load(self.cache_path()) as data:
+                self.values = data['values']
+                self.p1_wins = data['p1_wins']
+                self.p2_wins = data['p2_wins']
+                self.winning_masks = data['winning_masks']
+            return self
+
+        self._retrograde()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.savez_compressed(self.cache_path(), values=self.values, p1_wins=self.p1_wins,
+                                p2_wins=self.p2_wins, winning_masks=self.winning_masks)
+        return self
+
+    def _retrograde(self):
+        """Calcula las capas desde 0 movimientos restantes hacia arriba"""
+        n = self.board.num_positions
+        table = np.frombuffer(self.board.table, dtype=np.intc).reshape(-1, NUM_MOVES)
+        shape = (self.max_moves + 1, 2, n, n)
+        self.values = np.zeros(shape, dtype=np.int8)
+        self.p1_wins = np.zeros(shape, dtype=np.float64)
+        self.p2_wins = np.zeros(shape, dtype=np.float64)
+        self.winning_masks = np.zeros(shape, dtype=np.uint8)
+
+        p1_idx, p2_idx = np.indices((n, n))
+        bits = (1 << np.arange(NUM_MOVES)).astype(np.uint8)
+
+        for layer in range(1, self.max_moves + 1):
+            prev_v = self.values[layer - 1]
+            prev_w1 = self.p1_wins[layer - 1]
+            prev_w2 = self.p2_wins[layer - 1]
+
+            for turn in (0, 1):
+                mover_idx, other_idx = (p1_idx, p2_idx) if turn == 0 else (p2_idx, p1_idx)
+                dest = table[mover_idx + 1]
+                valid = (dest != 0) & (dest != other_idx[..., None] + 1)
+                won = valid & (dest == self.ends[turn])
+                cont = valid & ~won
+
+                # Estado siguiente: el rival mueve con una capa menos
+                dest_idx = np.where(cont, dest - 1, 0)
+                other_b = np.broadcast_to(other_idx[..., None], dest.shape)
+                if turn == 0:
+                    child = (1, dest_idx, other_b)
+                else:
+                    child = (0, other_b, dest_idx)
+                child_v = np.where(cont, prev_v[child], 0)
+                child_w1 = np.where(cont, prev_w1[child], 0.0)
+                child_w2 = np.where(cont, prev_w2[child], 0.0)
+
+                win_value = 1 if turn == 0 else -1
+                child_v = np.where(won, win_value, child_v)
+                if turn == 0:
+                    child_w1 = np.where(won, 1.0, child_w1)
+                else:
+                    child_w2 = np.where(won, 1.0, child_w2)
+
+                n_valid = valid.sum(axis=-1)
+                has_moves = n_valid > 0
+                if turn == 0:
+                    best = np.where(valid, child_v, -2).max(axis=-1)
+                else:
+                    best = np.where(valid, child_v, 2).min(axis=-1)
+                divisor = np.maximum(n_valid, 1)
+
+                # Sin movimientos válidos se pasa el turno consumiendo un movimiento
+                passed = 1 - turn
+                self.values[layer, turn] = np.where(has_moves, best, prev_v[passed])
+                self.p1_wins[layer, turn] = np.where(has_moves, child_w1.sum(axis=-1) / divisor,
+                                                     prev_w1[passed])
+                self.p2_wins[layer, turn] = np.where(has_moves, child_w2.sum(axis=-1) / divisor,
+                                                     prev_w2[passed])
+                winning = valid & (child_v == win_value)
+                self.winning_masks[layer, turn] = (winning * bits).sum(axis=-1, dtype=np.uint8)
+
+    def _index(self, p1_pos, p2_pos, turn, moves_left):
+        """Convierte un estado en índices de las tablas"""
+        if not 0 <= moves_left <= self.max_moves:
+            raise ValueError(f"moves_left debe estar entre 0 y {self.max_moves}")
+        self.solve()
+        return moves_left, PLAYERS.index(turn), p1_pos - 1, p2_pos - 1
+
+    def value(self, p1_pos, p2_pos, turn, moves_left):
+        """Valor con juego óptimo: 1 si gana P1, -1 si gana P2, 0 si se agota el límite"""
+        return int(self.values[self._index(p1_pos, p2_pos, turn, moves_left)])
+
+    def win_probability(self, p1_pos, p2_pos, turn, moves_left):
+        """Probabilidad de victoria de P1 y P2 si ambos juegan al azar como en auto_play"""
+        index = self._index(p1_pos, p2_pos, turn, moves_left)
+        return {'P1': float(self.p1_wins[index]), 'P2': float(self.p2_wins[index])}
+
+    def winning_moves(self, p1_pos, p2_pos, turn, moves_left):
+        """Movimientos que garantizan la victoria al jugador en turno con juego óptimo"""
+        mask = int(self.winning_masks[self._index(p1_pos, p2_pos, turn, moves_left)])
+        return [move for i, move in enumerate(MOVE_SYMBOLS) if mask >> i & 1]
+
+    def analyze(self, game):
+        """Analiza el estado actual de una partida del motor"""
+        args = (game.positions['P1']['current'], game.positions['P2']['current'],
+                game.turn, game.max_moves - game.current_move_count)
+        return {
+            'value': self.value(*args),
+            'win_probability': self.win_probability(*args),
+            'winning_moves': self.winning_moves(*args),
+        }
@@ -0,0 +1,23 @@
+import random
+
+from PIL import Image
+
+from exportar import render_frames
+from motor import GameEngine
+
+
+def _played_game():
+    random.seed(3)
+    game = GameEngine(board_size=4)
+    game.initialize_game(mode='auto', max_moves=12, seed=3)
+    game.auto_play()
+    return game
+
+
+def test_parallel_frames_match_serial(tmp_path):
+    game = _played_game()
+    serial = render_frames(game, str(tmp_path / 'serial'), workers=1, dpi=30)
+    parallel = render_frames(game, str(tmp_path / 'parallel'), workers=3, dpi=30)
+    assert len(serial) == len(parallel) == len(game.turn_log) + 1
+    for a, b in zip(serial, parallel):
+        assert Image.open(a).tobytes() == Image.open(b).tobytes(), b